@@ -1,9 +1,71 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import re
+from typing import Dict, Iterable, List, Optional
+
+# paper links returned by Semantic Scholar end with the paperId
+_S2_PAPER_LINK = re.compile(r"semanticscholar\.org/paper/(?:[^/]+/)?([0-9a-f]{40})\b", re.IGNORECASE)
+
+
+def article_identity(
+    paper_id: Optional[str],
+    external_ids: Optional[Dict[str, str]],
+    titulo: Optional[str],
+    link: Optional[str],
+) -> str:
+    """Return the key that identifies a paper, whatever its title spelling.
+
+    The Semantic Scholar paperId is preferred, read from the paper link when
+    the article was stored without it, then the DOI; the normalized title and
+    link are the last resort.
+    """
+
+    if paper_id:
+        return f"s2:{paper_id.lower()}"
+    match = _S2_PAPER_LINK.search(link or "")
+    if match:
+        return f"s2:{match.group(1).lower()}"
+    doi = (external_ids or {}).get("DOI")
+    if doi:
+        return f"doi:{doi.strip().lower()}"
+    return f"title:{(titulo or '').strip().lower()}|{(link or '').strip().lower()}"
 
 
 class Artigo:
+    """A stored article.
+
+    Its authors are kept as ids once the article belongs to a
+    :class:`~record_registry.RecordRegistry`, and as ``Autor`` objects before.
+    """
+
+    __slots__ = (
+        'id',
+        'titulo',
+        '_autores',
+        'publicado_em',
+        'data',
+        'citacoes',
+        'data_relativa',
+        'citacoes_relativa',
+        'relevance_relativa',
+        'cite_label',
+        'total_factor',
+        'impact_factor',
+        'link',
+        'cite',
+        'bibtex',
+        'synopsis',
+        'qualis',
+        'relevance_score',
+        'concepts',
+        'paper_id',
+        'external_ids',
+        'identity',
+        '_registry',
+    )
+    # pickled as a tuple of these slots, in this order
+    _STATE = __slots__[:-1]
+
     def __init__(
         self,
         titulo: str,
@@ -16,7 +78,11 @@ class Artigo:
         bibtex: str,
         synopsis: str,
         qualis: str,
+        paper_id: Optional[str] = None,
+        external_ids: Optional[Dict[str, str]] = None,
     ):
+        self.id: Optional[int] = None
+        self._registry = None
         self.titulo = titulo
         self.autores = autores
         self.publicado_em = publicado
@@ -24,6 +90,7 @@ class Artigo:
         self.citacoes = citacoes
         self.data_relativa = 0
         self.citacoes_relativa = 0
+        self.relevance_relativa = 0
         self.cite_label = 0
         self.total_factor = 0
         self.impact_factor = " "
@@ -34,6 +101,45 @@ class Artigo:
         self.qualis = qualis
         self.relevance_score = 0.0
         self.concepts = []
+        self.paper_id = paper_id
+        self.external_ids = dict(external_ids or {})
+        self.identity = article_identity(paper_id, self.external_ids, titulo, link)
+
+    @property
+    def autores(self) -> List["Autor"]:
+        if self._registry is None:
+            return list(self._autores)
+        return [self._registry.author(reference) for reference in self._autores]
+
+    @autores.setter
+    def autores(self, autores: List["Autor"]) -> None:
+        registry = self._registry
+        if registry is None:
+            self._autores = list(autores)
+        else:
+            self._autores = [
+                autor.id if autor._registry is registry else registry.add_author(autor).id for autor in autores
+            ]
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._STATE)
+
+    def __setstate__(self, state) -> None:
+        self._registry = None
+        if isinstance(state, tuple):
+            for name, value in zip(self._STATE, state):
+                setattr(self, name, value)
+            return
+
+        # an article pickled as a dict, with its Autor objects, before the records had ids
+        state = dict(_LEGACY_DEFAULTS, **state)
+        state["_autores"] = state.pop("autores", [])
+        state.setdefault("concepts", [])
+        state.setdefault("external_ids", {})
+        if "identity" not in state:
+            state["identity"] = article_identity(None, None, state["titulo"], state["link"])
+        for name in self._STATE:
+            setattr(self, name, state[name])
 
     def _other_title(self, other: object) -> Optional[str]:
         if isinstance(other, Artigo):
@@ -69,7 +175,7 @@ class Artigo:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Artigo):
             return NotImplemented
-        return (self.titulo, self.link) == (other.titulo, other.link)
+        return self.identity == other.identity
 
     def __ne__(self, other: object) -> bool:
         result = self.__eq__(other)
@@ -78,7 +184,29 @@ class Artigo:
         return not result
 
     def __hash__(self) -> int:
-        return hash((self.titulo, self.link))
+        return hash(self.identity)
+
+
+_LEGACY_DEFAULTS = {
+    "id": None,
+    "data_relativa": 0,
+    "citacoes_relativa": 0,
+    "relevance_relativa": 0,
+    "cite_label": 0,
+    "total_factor": 0,
+    "impact_factor": " ",
+    "relevance_score": 0.0,
+    "paper_id": None,
+}
+
+
+def unique_articles(artigos: Iterable[Artigo]) -> List[Artigo]:
+    """Return *artigos* without repeated papers, keeping the first of each identity."""
+
+    unique: Dict[str, Artigo] = {}
+    for artigo in artigos:
+        unique.setdefault(artigo.identity, artigo)
+    return list(unique.values())
 
 
 from typing import TYPE_CHECKING
@@ -4,14 +4,60 @@ from typing import List, Optional
 
 
 class Autor:
+    """A stored author.
+
+    Its articles are kept as ids once the author belongs to a
+    :class:`~record_registry.RecordRegistry`, and as ``Artigo`` objects
+    before. They are sorted by title when read, not on every insertion.
+    """
+
+    __slots__ = ('id', 'nome', 'link', '_artigos', '_artigos_sorted', '_registry')
+    # pickled as a tuple of these slots, in this order
+    _STATE = __slots__[:-1]
+
     def __init__(self, nome: str, link: Optional[str]):
+        self.id: Optional[int] = None
+        self._registry = None
         self.nome = nome
-        self.artigos: List["Artigo"] = []
         self.link = link
+        self._artigos: list = []
+        self._artigos_sorted = True
+
+    @property
+    def artigos(self) -> List["Artigo"]:
+        if self._registry is None:
+            artigos = self._artigos
+        else:
+            artigos = [self._registry.article(reference) for reference in self._artigos]
+        if not self._artigos_sorted:
+            artigos.sort()
+            if self._registry is not None:
+                self._artigos = [artigo.id for artigo in artigos]
+            self._artigos_sorted = True
+        return list(artigos)
 
     def addArtigo(self, artigo: "Artigo") -> None:
-        self.artigos.append(artigo)
-        self.artigos.sort()
+        if self._registry is not None:
+            artigo = artigo.id if artigo._registry is self._registry else self._registry.add_article(artigo).id
+        self._artigos.append(artigo)
+        self._artigos_sorted = False
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._STATE)
+
+    def __setstate__(self, state) -> None:
+        self._registry = None
+        if isinstance(state, tuple):
+            for name, value in zip(self._STATE, state):
+                setattr(self, name, value)
+            return
+
+        # an author pickled as a dict, with its Artigo objects, before the records had ids
+        self.id = None
+        self.nome = state["nome"]
+        self.link = state.get("link")
+        self._artigos = list(state.get("artigos", []))
+        self._artigos_sorted = True
 
     def _other_name(self, other: object) -> Optional[str]:
         if isinstance(other, Autor):
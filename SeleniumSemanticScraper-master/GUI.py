@@ -36,6 +36,7 @@ class GUI:
         self.year_filter_choice = 'Toutes les parutions'
         self.keyword_criteria = []
         self.keyword_fields = []
+        self.refresh_cache = False
 
         self.crawler.gui = self
 
@@ -115,6 +116,12 @@ class GUI:
             row=11,
         )
         self.app.setMessageWidth('Keywords_Translation_Note', 500)
+        # answers are cached for a week; this asks Semantic Scholar again
+        self.app.addNamedCheckBox(
+            'Ignorer les résultats en cache (interroger à nouveau Semantic Scholar)',
+            'Refresh_Cache',
+            row=12,
+        )
         self.app.setStretch('both')
         self.app.setSticky('se')
         self.app.addNamedButton('Suivant', 'Next1', self.press)
@@ -183,6 +190,15 @@ class GUI:
             max_attempts=max_attempts,
         )
 
+    def notify_rate_status(self, rate, queue_depth):
+        def _update_ui():
+            self.app.setLabel(
+                'rate_limiter_label',
+                f"Débit : {rate:.2f} requête(s)/s – {queue_depth} requête(s) en attente",
+            )
+
+        self.app.queueFunction(_update_ui)
+
     def notify_strategy_started(self, description, position, total):
         def _update_ui():
             self.app.setLabel(
@@ -259,6 +275,7 @@ class GUI:
         self.app.setStretch('column')
         self.app.setSticky('nwe')
         self.app.addLabel('progress_bar_label', 'Appuyez sur « Lancer la recherche »')
+        self.app.addLabel('rate_limiter_label', '')
         self.app.setStretch('both')
         self.app.setSticky('nswe')
         
@@ -417,12 +434,14 @@ class GUI:
             pages=self.input_pages,
             year_filter=self.year_filter_choice,
             keyword_rules=self.keyword_criteria,
+            refresh=self.refresh_cache,
         )
         self.crawler.update_search_parameters(
             self.search_phrase,
             self.input_pages,
             self.year_filter_choice,
             self.keyword_criteria,
+            refresh=self.refresh_cache,
         )
         log_event("SEARCH_START", "Lancement de la collecte via le crawler")
         self.crawler.start_search()
@@ -441,6 +460,7 @@ class GUI:
             self.input_pages = self.app.getScale('Quantity_scale')
             self.year_filter_choice = self.app.getOptionBox('Year_Filter_Option')
             self.keyword_criteria = self._collect_keyword_criteria()
+            self.refresh_cache = self.app.getCheckBox('Refresh_Cache')
             log_event(
                 "USER_SELECTION",
                 "Configuration de la recherche validée",
@@ -448,6 +468,7 @@ class GUI:
                 pages=self.input_pages,
                 year_filter=self.year_filter_choice,
                 keywords=self.keyword_criteria,
+                refresh=self.refresh_cache,
             )
             if self.input_pages == 0:
                 self.app.errorBox('Erreur', 'Choisir 0 article annulera la recherche !')
@@ -1,11 +1,35 @@
+import gc
 import os
 import pickle
 from pathlib import Path
 
-from activity_logger import log_event
+from Artigo import unique_articles
+from activity_logger import log_event, log_exception
+from record_registry import RecordRegistry
 from storage_helper import resolve_storage_paths
 
 
+def _load_records(path, add):
+    # every object unpickled stays alive, so the collections it would trigger free nothing
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        with open(path, 'rb') as file_input:
+            return [add(record) for record in pickle.load(file_input)]
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def load_records(directory):
+    """Return the articles and authors saved in a search *directory*, bound to one registry."""
+
+    registry = RecordRegistry()
+    artigos = _load_records(os.path.join(directory, 'Articles.pkl'), registry.add_article)
+    autores = _load_records(os.path.join(directory, 'Authors.pkl'), registry.add_author)
+    return artigos, autores
+
+
 class Gerenciador:
     def __init__(self, palavraChave, root_directory):
         self.root_directory = root_directory
@@ -18,6 +42,11 @@ class Gerenciador:
         self.diretorio_files = os.path.join(self.root_directory, 'Results')
         self.arquivo_autores = str(authors_path)
         self.arquivo_artigos = str(articles_path)
+        self.arquivo_checkpoint = str(Path(self.storage_dir) / 'Checkpoint.pkl')
+        # the records of both files refer to each other by id through this registry
+        self.registry = RecordRegistry(load_missing=self._carregaRegistros)
+        self._autores_carregados = False
+        self._artigos_carregados = False
         self.inicializaPrograma()
         log_event(
             "STORAGE_READY",
@@ -27,25 +56,63 @@ class Gerenciador:
         )
 
     def loadAutores(self):
-        with open(self.arquivo_autores, 'rb') as file_input:
-            lista_autores = pickle.load(file_input)
+        lista_autores = _load_records(self.arquivo_autores, self.registry.add_author)
+        self._autores_carregados = True
         return lista_autores
 
     def loadArtigos(self):
-        with open(self.arquivo_artigos, 'rb') as file_input:
-            lista_artigos = pickle.load(file_input)
+        lista_artigos = _load_records(self.arquivo_artigos, self.registry.add_article)
+        self._artigos_carregados = True
         return lista_artigos
 
+    def _carregaRegistros(self):
+        # an id was read before the file holding its record
+        if not self._artigos_carregados:
+            self.loadArtigos()
+        if not self._autores_carregados:
+            self.loadAutores()
+
     def saveAutores(self, lista_autores):
         lista_autores.sort()
         with open(self.arquivo_autores, 'wb') as file_output:
             pickle.dump(lista_autores, file_output, -1)
 
     def saveArtigos(self, lista_artigos):
+        # one entry per paper, even when it was stored under another title
+        lista_artigos[:] = unique_articles(lista_artigos)
         lista_artigos.sort()
         with open(self.arquivo_artigos, 'wb') as file_output:
             pickle.dump(lista_artigos, file_output, -1)
 
+    def loadCheckpoint(self):
+        # progress of an interrupted crawl, see Crawler._load_checkpoint
+        if not os.path.isfile(self.arquivo_checkpoint):
+            return None
+        try:
+            with open(self.arquivo_checkpoint, 'rb') as file_input:
+                return pickle.load(file_input)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as exc:
+            log_exception(
+                "STORAGE_CHECKPOINT_ERROR",
+                "Point de sauvegarde illisible, la collecte repart de zéro",
+                exc,
+                path=self.arquivo_checkpoint,
+            )
+            return None
+
+    def saveCheckpoint(self, checkpoint):
+        # written next to the target and renamed, so a crash never leaves half a file
+        temporary = self.arquivo_checkpoint + '.tmp'
+        with open(temporary, 'wb') as file_output:
+            pickle.dump(checkpoint, file_output, -1)
+        os.replace(temporary, self.arquivo_checkpoint)
+
+    def removeCheckpoint(self):
+        try:
+            os.remove(self.arquivo_checkpoint)
+        except FileNotFoundError:
+            pass
+
     def inicializaAutores(self):
         lista_autores = []
         with open(self.arquivo_autores, 'wb') as file_output:
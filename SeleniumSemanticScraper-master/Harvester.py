@@ -0,0 +1,104 @@
+"""Command-line harvest of a search, without the graphical interface.
+
+The interface caps a search at 100 articles. A harvest goes through
+``/paper/search/bulk`` instead and can collect thousands of them; the
+results are stored in the same ``Results`` folder as a search started from
+the interface, so they can be exported, re-scored or merged afterwards.
+
+Usage::
+
+    python Harvester.py "detection dog" --limit 10000 --required chien
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from typing import Optional, Sequence
+
+from SemanticScholarMetaCrawler import Crawler
+from activity_logger import log_event
+
+
+class ConsoleReporter:
+    """Stands in for the interface: the crawler's notifications are printed."""
+
+    # read by the crawler when it exports, never true for a harvest
+    single_or_merge = False
+
+    def __init__(self):
+        self.failure: Optional[str] = None
+        self.added = 0
+
+    def notify_strategy_started(self, description, position, total):
+        print(f"[{position}/{total}] {description}")
+
+    def notify_strategy_results(self, description, new_items, total_items):
+        print(f"{description} : {new_items} nouvel(s) article(s) sur {total_items}")
+
+    def notify_rate_limit(self, wait_seconds, attempt, max_attempts):
+        print(f"Limite de requêtes atteinte, nouvelle tentative dans {wait_seconds:.0f} s ({attempt}/{max_attempts})")
+
+    def notify_transient_error(self, wait_seconds, attempt, max_attempts):
+        print(f"Erreur temporaire du service, nouvelle tentative dans {wait_seconds:.0f} s ({attempt}/{max_attempts})")
+
+    def notify_rate_status(self, rate, queue_depth):
+        pass
+
+    def show_search_done_alert(self, time, quantity):
+        self.added = int(quantity)
+        print(f"Collecte achevée en {time.seconds} seconde(s) avec {quantity} article(s) récupéré(s).")
+
+    def show_search_failed_alert(self, message):
+        self.failure = message
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Collecte massive d’articles Semantic Scholar sans interface.")
+    parser.add_argument('search', help="phrase de recherche")
+    parser.add_argument('--limit', type=int, default=10000, help="nombre d’articles à conserver (10000 par défaut)")
+    parser.add_argument('--years', type=int, choices=(5, 10, 20), default=None, help="seulement les parutions récentes")
+    parser.add_argument('--required', action='append', default=[], help="mot-clé indispensable (répétable)")
+    parser.add_argument('--optional', action='append', default=[], help="mot-clé facultatif (répétable)")
+    parser.add_argument(
+        '--strategies',
+        action='store_true',
+        help="utilise les stratégies de recherche de l’interface au lieu de /paper/search/bulk",
+    )
+    parser.add_argument(
+        '--async-engine',
+        action='store_true',
+        help="avec --strategies, envoie les requêtes des stratégies depuis une boucle asyncio (httpx)",
+    )
+    parser.add_argument('--refresh', action='store_true', help="ignore les réponses en cache")
+    args = parser.parse_args(argv)
+    if args.limit <= 0:
+        parser.error("--limit doit être positif")
+    if args.async_engine and not args.strategies:
+        parser.error("--async-engine ne s’applique qu’avec --strategies")
+
+    keyword_rules = [{'term': term, 'importance': 'required'} for term in args.required]
+    keyword_rules += [{'term': term, 'importance': 'optional'} for term in args.optional]
+
+    reporter = ConsoleReporter()
+    crawler = Crawler(os.getcwd())
+    crawler.gui = reporter
+    crawler.update_search_parameters(
+        args.search,
+        args.limit,
+        args.years,
+        keyword_rules,
+        bulk=not args.strategies,
+        refresh=args.refresh,
+        async_engine=args.async_engine,
+    )
+    log_event("HARVEST_START", "Collecte lancée en ligne de commande", query=args.search, limit=args.limit)
+    crawler.start_search()
+    if reporter.failure is not None:
+        print(reporter.failure, file=sys.stderr)
+        sys.exit(1)
+    print(f"Résultats enregistrés dans {crawler.manager.storage_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from pathlib import Path
 
 import requests
 
+from Artigo import unique_articles
 from Gerenciador import Gerenciador
 import Timer
 from NetworkHelper import configure_session_for_tor
@@ -13,7 +14,8 @@ class PDFDownloader:
         self.search = search
         self.root_directory = current_directory
         self.manager = Gerenciador(self.search, self.root_directory)
-        self.list_articles = self.manager.loadArtigos()
+        # a paper stored twice is downloaded once
+        self.list_articles = unique_articles(self.manager.loadArtigos())
         self.gui = gui
         self.downloaded_files_quant = 0
 
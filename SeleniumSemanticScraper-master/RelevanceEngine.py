@@ -1,26 +1,22 @@
+import hashlib
+import json
 import math
+import os
+import pickle
 import re
+import threading
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Iterable, List, Sequence, Set, Tuple
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
-
-def _normalize(text: str) -> str:
-    cleaned = re.sub(r"[^\w\s-]", " ", text.lower())
-    cleaned = re.sub(r"[_-]+", " ", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    return cleaned
-
-
-def _dedupe_tokens(text: str) -> str:
-    tokens = [token for token in re.split(r"\s+", text.strip()) if token]
-    deduped = []
-    for token in tokens:
-        if deduped and token.lower() == deduped[-1].lower():
-            continue
-        deduped.append(token)
-    return " ".join(deduped)
+from TranslationHelper import build_text_variants
+from activity_logger import log_event, log_exception
+from text_normalizer import dedupe_tokens, normalize_text
 
 
 def _pluralize(base: str) -> Set[str]:
@@ -44,130 +40,290 @@ def _pluralize(base: str) -> Set[str]:
     return results
 
 
-_SYNONYM_BANK = {
-    "dog": {"dog", "dogs", "canine", "canines", "chien", "chiens", "k9", "k-9", "working dog"},
-    "canine": {"canine", "canines", "chien", "chiens", "k9", "dog", "dogs"},
-    "mine": {
-        "mine",
-        "mines",
-        "landmine",
-        "landmines",
-        "land mine",
-        "land mines",
-        "uxo",
-        "ordnance",
-        "explosive",
-        "explosives",
-        "ied",
-        "ieds",
-        "munition",
-        "munitions",
-    },
-    "detection": {
-        "detection",
-        "detect",
-        "detects",
-        "detecting",
-        "detected",
-        "detector",
-        "detectors",
-        "repérage",
-        "détection",
-        "détecteur",
-        "détecteurs",
-        "identification",
-    },
-    "explosive": {
-        "explosive",
-        "explosives",
-        "explosif",
-        "explosifs",
-        "bomb",
-        "bombs",
-        "bomblet",
-        "mine",
-        "ordnance",
-        "ied",
-        "ieds",
-        "uxo",
-    },
-    "odor": {
-        "odor",
-        "odors",
-        "odour",
-        "odours",
-        "scent",
-        "scents",
-        "olfaction",
-        "olfactory",
-        "olfactif",
-        "odorant",
-        "odorants",
-        "smell",
-        "smells",
-        "sniff",
-        "sniffing",
-    },
-    "dog-handler": {"handler", "guide", "team", "binôme", "handler"},
-    "robot": {"robot", "robotics", "robotique", "autonomous", "autonome"},
-    "review": {"review", "survey", "overview", "state of the art", "revue"},
-}
-
-_PHRASE_SYNONYMS = {
-    "mine detection": {
-        "mine detection",
-        "landmine detection",
-        "explosive detection",
-        "explosives detection",
-        "bomb detection",
-        "detection de mine",
-        "détection de mines",
-        "détection des mines",
-    },
-    "explosive detection": {
-        "explosive detection",
-        "explosives detection",
-        "explosive sniffing",
-        "explosive sensing",
-        "explosive trace detection",
-        "détection d'explosifs",
-    },
-    "detection dog": {
-        "detection dog",
-        "detection dogs",
-        "explosive detection dog",
-        "sniffer dog",
-        "chien détecteur",
-        "chien de détection",
-        "chien démineur",
-    },
-    "search dog": {
-        "search dog",
-        "search dogs",
-        "working dog",
-        "chien de recherche",
-        "chien pisteur",
-    },
-}
-
-
-def _merge_synonyms(base: str) -> Set[str]:
-    words = _SYNONYM_BANK.get(base, set())
+_DATA_DIRECTORY = Path(__file__).resolve().parent / "Data"
+_SYNONYMS_PATH = _DATA_DIRECTORY / "synonyms.json"
+_COMPILED_SYNONYMS_PATH = _DATA_DIRECTORY / "synonyms.pkl"
+# bump when the expansion rules or the SynonymTables layout change
+_COMPILED_SYNONYMS_VERSION = 1
+
+
+def _expand_forms(words: Iterable[str]) -> Set[str]:
     expanded: Set[str] = set()
-    for word in {base, *words}:
+    for word in words:
         expanded |= _pluralize(word)
         expanded.add(word)
-    return {w for w in expanded if len(w) > 2}
+    return expanded
+
+
+class SynonymTables:
+    """Synonym and phrase banks with every form already pluralized and normalized.
+
+    ``synonyms`` maps a query token and ``phrases`` a multi-word query phrase
+    to their raw synonyms, which are kept for display. The expanded, normalized
+    forms are computed once here, and the phrases are arranged in a token trie
+    so the n-grams of a query are looked up in a single pass.
+    """
+
+    def __init__(self, synonyms: dict, phrases: dict):
+        self.synonyms = {token: frozenset(words) for token, words in synonyms.items()}
+        self.phrases = {phrase: frozenset(words) for phrase, words in phrases.items()}
+        self.token_terms = {token: self._token_terms(token, words) for token, words in self.synonyms.items()}
+        self.phrase_terms = {
+            phrase: frozenset(term for term in map(normalize_text, _expand_forms(words)) if term)
+            for phrase, words in self.phrases.items()
+        }
+        self.phrase_trie: dict = {}
+        for phrase in self.phrases:
+            parts = phrase.split()
+            if len(parts) < 2:
+                continue
+            node = self.phrase_trie
+            for part in parts:
+                node = node.setdefault(part, {})
+            # tokens are never empty, so "" can mark the end of a phrase
+            node[""] = phrase
+
+    @classmethod
+    def from_file(cls, path: Path) -> "SynonymTables":
+        with open(path, encoding="utf-8") as file_input:
+            data = json.load(file_input)
+        return cls(data.get("synonyms", {}), data.get("phrases", {}))
+
+    @staticmethod
+    def _token_terms(token: str, words: Iterable[str]) -> frozenset:
+        expanded = {word for word in _expand_forms({token, *words}) if len(word) > 2}
+        expanded.add(token)
+        return frozenset(term for term in map(normalize_text, expanded) if term)
+
+    def expand_token(self, token: str) -> frozenset:
+        terms = self.token_terms.get(token)
+        return terms if terms is not None else self._token_terms(token, ())
+
+    def find_phrases(self, tokens: Sequence[str]) -> List[str]:
+        """Return the known phrases among the n-grams of *tokens*, longest first."""
+
+        found = []
+        for start in range(len(tokens)):
+            node = self.phrase_trie
+            for token in tokens[start:]:
+                node = node.get(token)
+                if node is None:
+                    break
+                if "" in node:
+                    found.append((-len(node[""].split()), start, node[""]))
+        return [phrase for _, _, phrase in sorted(found)]
+
+
+def load_synonym_tables(
+    path: Path = _SYNONYMS_PATH,
+    compiled_path: Path = _COMPILED_SYNONYMS_PATH,
+) -> SynonymTables:
+    """Return the tables of *path*, compiled once and cached next to it.
+
+    The compiled file is reused while the SHA-256 of the data file matches;
+    otherwise the data file is expanded again and the compiled file rewritten.
+    """
+
+    with open(path, 'rb') as file_input:
+        fingerprint = hashlib.sha256(file_input.read()).hexdigest()
+    try:
+        with open(compiled_path, 'rb') as file_input:
+            compiled = pickle.load(file_input)
+        if compiled.get('version') == _COMPILED_SYNONYMS_VERSION and compiled.get('fingerprint') == fingerprint:
+            return compiled['tables']
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, KeyError) as exc:
+        log_exception("SYNONYM_TABLES", "Tables de synonymes compilées illisibles", exc, path=str(compiled_path))
+
+    tables = SynonymTables.from_file(path)
+    compiled = {'version': _COMPILED_SYNONYMS_VERSION, 'fingerprint': fingerprint, 'tables': tables}
+    temporary_path = Path(f"{compiled_path}.tmp")
+    try:
+        with open(temporary_path, 'wb') as file_output:
+            pickle.dump(compiled, file_output, -1)
+        os.replace(temporary_path, compiled_path)
+    except OSError as exc:
+        log_exception("SYNONYM_TABLES", "Écriture des tables de synonymes compilées impossible", exc, path=str(compiled_path))
+    else:
+        log_event(
+            "SYNONYM_TABLES",
+            "Tables de synonymes compilées",
+            path=str(compiled_path),
+            synonyms=len(tables.synonyms),
+            phrases=len(tables.phrases),
+        )
+    return tables
+
+
+_load_lock = threading.Lock()
+_synonym_tables: SynonymTables | None = None
+
+
+def get_synonym_tables() -> SynonymTables:
+    global _synonym_tables
+    with _load_lock:
+        if _synonym_tables is None:
+            _synonym_tables = load_synonym_tables()
+    return _synonym_tables
+
+
+@lru_cache(maxsize=256)
+def _query_concepts(normalized_query: str) -> Tuple[Tuple[str, frozenset, frozenset, float], ...]:
+    """Return ``(name, terms, display_terms, weight)`` for the phrases and tokens of a query."""
+
+    tables = get_synonym_tables()
+    tokens = [token for token in normalized_query.split(" ") if len(token) > 2]
+    concepts = []
+
+    used_indices: Set[int] = set()
+    for phrase in tables.find_phrases(tokens):
+        parts = phrase.split()
+        start = normalized_query.split().index(parts[0]) if parts[0] in tokens else None
+        if start is not None:
+            for offset in range(len(parts)):
+                try:
+                    used_indices.add(tokens.index(parts[offset], start + offset if offset else start))
+                except ValueError:
+                    continue
+        terms = tables.phrase_terms[phrase]
+        if terms:
+            display_options = {phrase, *tables.phrases[phrase]}
+            concepts.append((phrase, terms, frozenset(option for option in display_options if option), 1.5))
+
+    for index, token in enumerate(tokens):
+        if index in used_indices:
+            continue
+        terms = tables.expand_token(token)
+        if terms:
+            display_options = {token, *tables.synonyms.get(token, ())}
+            concepts.append((token, terms, frozenset(option for option in display_options if option), 1.0))
+
+    return tuple(concepts)
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def _render(node: dict) -> str:
+        branches = [re.escape(char) + _render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # greedy: a longer term is preferred when one starts at the same position
+            return f"(?:{body})?"
+        return body
+
+    return _render(trie)
+
+
+class _TermMatcher:
+    """Find every term occurring in a text with a single regular expression scan.
+
+    The terms are compiled into a trie-shaped pattern wrapped in a lookahead,
+    so each position of the text reports the longest term starting there. The
+    shorter terms starting at the same position are its prefixes, which are
+    precomputed; the result is the same set as ``{t for t in terms if t in text}``.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        unique_terms = {term for term in terms if term}
+        self._pattern = re.compile(f"(?=({_trie_pattern(unique_terms)}))") if unique_terms else None
+        self._prefix_terms = {
+            term: frozenset(term[:size] for size in range(1, len(term) + 1) if term[:size] in unique_terms)
+            for term in unique_terms
+        }
+
+    def find(self, text: str) -> Set[str]:
+        hits: Set[str] = set()
+        if not text or self._pattern is None:
+            return hits
+        for longest in set(self._pattern.findall(text)):
+            hits |= self._prefix_terms[longest]
+        return hits
+
+
+@lru_cache(maxsize=256)
+def _term_matcher(terms: frozenset) -> _TermMatcher:
+    # matchers are read-only once built, so engines for the same terms share one
+    return _TermMatcher(terms)
+
+
+def _text_variants(text: str, translate: bool) -> List[str]:
+    if translate:
+        return list(build_text_variants(text or ""))
+    cleaned = (text or "").strip()
+    return [cleaned] if cleaned else []
+
+
+def build_translated_query(text: str, translate: bool = True) -> str:
+    """Return *text* followed by its English translation, as sent to Semantic Scholar."""
+
+    variants = _text_variants(text, translate)
+    if not variants:
+        return ""
+    joined = " ".join(variants)
+    cleaned = dedupe_tokens(joined)
+    log_event(
+        "QUERY_VARIANTS",
+        "Requête enrichie avec variantes",
+        original=text,
+        variants=variants,
+        normalized=cleaned,
+    )
+    return cleaned
+
+
+def prepare_keyword_constraints(
+    keyword_rules: Iterable[dict],
+    translate: bool = True,
+) -> Tuple[List[dict], List[dict]]:
+    """Split the GUI keyword rules into the mandatory and optional engine keywords."""
+
+    mandatory = []
+    optional = []
+
+    for keyword in keyword_rules:
+        term = (keyword.get('term') or '').strip()
+        if not term:
+            continue
+
+        variants = _text_variants(term, translate)
+        if not variants:
+            continue
+
+        entry = {
+            'label': term,
+            'forms': variants,
+            'display_terms': set(variants),
+        }
+        log_event(
+            "KEYWORD_VARIANTS",
+            "Critère enrichi",
+            original=term,
+            variants=variants,
+            importance=keyword.get('importance'),
+        )
+
+        if keyword.get('importance') == 'required':
+            mandatory.append(entry)
+        else:
+            optional.append(entry)
 
+    log_event(
+        "KEYWORD_SUMMARY",
+        "Résumé des contraintes de mots-clés",
+        mandatory=len(mandatory),
+        optional=len(optional),
+    )
+    return mandatory, optional
 
-def _extract_phrases(tokens: Sequence[str]) -> List[str]:
-    phrases: List[str] = []
-    for size in (3, 2):
-        for index in range(len(tokens) - size + 1):
-            phrase = " ".join(tokens[index:index + size])
-            if phrase in _PHRASE_SYNONYMS:
-                phrases.append(phrase)
-    return phrases
 
 @dataclass(frozen=True)
 class ConceptGroup:
@@ -188,6 +344,131 @@ class RelevanceResult:
     mandatory_missing: Set[str]
     mandatory_hits: Set[str]
     optional_hits: Set[str]
+    # "complete", or the name of the staged-evaluation check that rejected it
+    stage: str = "complete"
+
+
+class ArticleIndex:
+    """Inverted index over the title and synopsis of stored articles.
+
+    Articles are tokenized once when added; the postings (document ids and
+    term frequencies, grouped by term) and the document lengths and norms
+    are NumPy arrays, rebuilt lazily after each :meth:`add`. Scoring a query
+    then only touches the postings of its terms, so stored articles can be
+    re-ranked for a new query without any API call.
+    """
+
+    def __init__(self, articles: Iterable[object] = (), k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.articles: List[object] = []
+        self.vocabulary: dict = {}
+        self._lengths: List[int] = []
+        # postings added since the last compilation, as (term ids, doc ids, frequencies) chunks
+        self._pending: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._term_ids = np.empty(0, dtype=np.int32)
+        self._doc_ids = np.empty(0, dtype=np.int32)
+        self._frequencies = np.empty(0, dtype=np.float32)
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._document_lengths = np.empty(0, dtype=np.float32)
+        self._tfidf_norms = np.empty(0, dtype=np.float32)
+        self.add(articles)
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def add(self, articles: Iterable[object]) -> None:
+        """Index *articles*, anything with ``titulo`` and ``synopsis`` attributes."""
+
+        term_ids: List[int] = []
+        doc_ids: List[int] = []
+        frequencies: List[int] = []
+        for article in articles:
+            doc_id = len(self.articles)
+            tokens = (
+                normalize_text(getattr(article, 'titulo', '') or '').split()
+                + normalize_text(getattr(article, 'synopsis', '') or '').split()
+            )
+            for token, count in Counter(tokens).items():
+                term_ids.append(self.vocabulary.setdefault(token, len(self.vocabulary)))
+                doc_ids.append(doc_id)
+                frequencies.append(count)
+            self.articles.append(article)
+            self._lengths.append(len(tokens))
+        if term_ids:
+            self._pending.append(
+                (
+                    np.asarray(term_ids, dtype=np.int32),
+                    np.asarray(doc_ids, dtype=np.int32),
+                    np.asarray(frequencies, dtype=np.float32),
+                )
+            )
+
+    def _compile(self) -> None:
+        if not self._pending and len(self._document_lengths) == len(self.articles):
+            return
+
+        term_ids = np.concatenate([self._term_ids, *(chunk[0] for chunk in self._pending)])
+        doc_ids = np.concatenate([self._doc_ids, *(chunk[1] for chunk in self._pending)])
+        frequencies = np.concatenate([self._frequencies, *(chunk[2] for chunk in self._pending)])
+        self._pending = []
+
+        order = np.argsort(term_ids, kind="stable")
+        self._term_ids = term_ids[order]
+        self._doc_ids = doc_ids[order]
+        self._frequencies = frequencies[order]
+        counts = np.bincount(self._term_ids, minlength=len(self.vocabulary))
+        self._offsets = np.concatenate(([0], np.cumsum(counts)))
+        self._document_lengths = np.asarray(self._lengths, dtype=np.float32)
+
+        # the norms depend on the idf of every term, so they follow the corpus size
+        weights = (1.0 + np.log(self._frequencies)) * self._tfidf_idf(counts)[self._term_ids]
+        norms = np.bincount(self._doc_ids, weights=weights * weights, minlength=len(self.articles))
+        self._tfidf_norms = np.sqrt(norms).astype(np.float32)
+
+    def _tfidf_idf(self, document_frequencies: np.ndarray) -> np.ndarray:
+        return np.log((1.0 + len(self.articles)) / (1.0 + document_frequencies)) + 1.0
+
+    def scores(self, query_weights: dict, mode: str = "bm25") -> np.ndarray:
+        """Return the score of every indexed article for ``{token: weight}``.
+
+        *mode* is ``"bm25"`` (Okapi BM25) or ``"tfidf"`` (cosine similarity
+        of log-scaled TF-IDF vectors, the query weights acting as its vector).
+        """
+
+        if mode not in ("bm25", "tfidf"):
+            raise ValueError(f"Mode de pondération inconnu : {mode}")
+
+        self._compile()
+        totals = np.zeros(len(self.articles), dtype=np.float64)
+        if not self.articles:
+            return totals
+
+        document_count = len(self.articles)
+        average_length = float(self._document_lengths.mean()) or 1.0
+        query_norm = 0.0
+        for token, weight in query_weights.items():
+            term_id = self.vocabulary.get(token)
+            if term_id is None or not weight:
+                continue
+            start, end = self._offsets[term_id], self._offsets[term_id + 1]
+            docs = self._doc_ids[start:end]
+            frequencies = self._frequencies[start:end]
+            document_frequency = end - start
+            if mode == "bm25":
+                idf = math.log(1.0 + (document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+                length_ratio = self._document_lengths[docs] / average_length
+                saturation = frequencies * (self.k1 + 1.0) / (frequencies + self.k1 * (1.0 - self.b + self.b * length_ratio))
+                totals[docs] += weight * idf * saturation
+            else:
+                idf = math.log((1.0 + document_count) / (1.0 + document_frequency)) + 1.0
+                totals[docs] += weight * idf * idf * (1.0 + np.log(frequencies))
+                query_norm += (weight * idf) ** 2
+
+        if mode == "tfidf" and query_norm:
+            norms = np.where(self._tfidf_norms > 0, self._tfidf_norms, 1.0)
+            totals /= norms * math.sqrt(query_norm)
+        return totals
 
 
 class QueryRelevanceEngine:
@@ -199,63 +480,20 @@ class QueryRelevanceEngine:
         optional_keywords: Iterable[dict] | None = None,
     ):
         self.raw_query = raw_query or ""
-        self.normalized_query = _normalize(self.raw_query)
-        tokens = [token for token in self.normalized_query.split(" ") if len(token) > 2]
+        self.normalized_query = normalize_text(self.raw_query)
         self.keyword_groups: List[Set[str]] = []
         self.keyword_terms: Set[str] = set()
         self.concept_groups: List[ConceptGroup] = []
         self.mandatory_keywords: List[Tuple[str, Set[str]]] = []
         self.optional_keywords: List[Tuple[str, Set[str]]] = []
 
-        phrases = _extract_phrases(tokens)
-        used_indices: Set[int] = set()
-        for phrase in phrases:
-            parts = phrase.split()
-            start = self.normalized_query.split().index(parts[0]) if parts[0] in tokens else None
-            if start is not None:
-                for offset in range(len(parts)):
-                    try:
-                        used_indices.add(tokens.index(parts[offset], start + offset if offset else start))
-                    except ValueError:
-                        continue
-            expanded = set()
-            for synonym in _PHRASE_SYNONYMS[phrase]:
-                expanded |= _pluralize(synonym)
-                expanded.add(synonym)
-            normalized = {_normalize(term) for term in expanded}
-            normalized = {term for term in normalized if term}
-            if normalized:
-                self.keyword_groups.append(normalized)
-                self.keyword_terms |= normalized
-                display_options = {phrase, *_PHRASE_SYNONYMS[phrase]}
-                self.concept_groups.append(
-                    ConceptGroup(
-                        name=phrase,
-                        terms=normalized,
-                        display_terms={option for option in display_options if option},
-                        weight=1.5,
-                    )
-                )
-
-        for index, token in enumerate(tokens):
-            if index in used_indices:
-                continue
-            expanded = _merge_synonyms(token)
-            expanded.add(token)
-            normalized = {_normalize(term) for term in expanded}
-            normalized = {term for term in normalized if term}
-            if normalized:
-                self.keyword_groups.append(normalized)
-                self.keyword_terms |= normalized
-                display_options = {token, *_SYNONYM_BANK.get(token, set())}
-                self.concept_groups.append(
-                    ConceptGroup(
-                        name=token,
-                        terms=normalized,
-                        display_terms={option for option in display_options if option},
-                        weight=1.0,
-                    )
-                )
+        for name, terms, display_terms, weight in _query_concepts(self.normalized_query):
+            normalized = set(terms)
+            self.keyword_groups.append(normalized)
+            self.keyword_terms |= normalized
+            self.concept_groups.append(
+                ConceptGroup(name=name, terms=normalized, display_terms=set(display_terms), weight=weight)
+            )
 
         self._integrate_user_keywords(mandatory_keywords, optional_keywords)
 
@@ -278,9 +516,27 @@ class QueryRelevanceEngine:
 
         self.dynamic_threshold = 42 if len(self.keyword_groups) >= 3 else 35
 
+        # every group, mandatory and optional term is also in keyword_terms
+        self._matcher = _term_matcher(frozenset(self.keyword_terms))
+        self.stage_counts: Counter = Counter()
+        # the crawler evaluates the pages of several strategies from worker threads
+        self._stage_lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # Rescorer ships the engine to worker processes: a lock cannot be
+        # pickled, and the stage counts belong to this process
+        state = dict(self.__dict__)
+        del state["_stage_lock"], state["stage_counts"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.stage_counts = Counter()
+        self._stage_lock = threading.Lock()
+
     @staticmethod
     def normalize_text(text: str) -> str:
-        return _normalize(text)
+        return normalize_text(text)
 
     def _integrate_user_keywords(
         self,
@@ -307,9 +563,9 @@ class QueryRelevanceEngine:
                     continue
 
                 normalized_forms = {
-                    _normalize(str(value))
+                    normalize_text(str(value))
                     for value in forms
-                    if _normalize(str(value))
+                    if normalize_text(str(value))
                 }
                 if not normalized_forms:
                     continue
@@ -336,19 +592,137 @@ class QueryRelevanceEngine:
         _process_keywords(optional_keywords, self.optional_keywords, 0.8, False)
 
     def _matched_terms(self, text: str) -> Set[str]:
-        hits: Set[str] = set()
-        for term in self.keyword_terms:
-            if not term:
-                continue
-            if term in text:
-                hits.add(term)
-        return hits
+        return self._matcher.find(text)
+
+    def evaluate(self, title: str, abstract: str, staged: bool = False) -> RelevanceResult:
+        """Score one article.
+
+        With ``staged=True`` the cheap keyword checks run first and an article
+        that :meth:`should_keep` would reject whatever its score is returned
+        without computing the fuzzy ratios; its ``score`` is then ``0.0`` and
+        ``stage`` names the check. ``stage_counts`` tallies the exits.
+        """
+
+        normalized_title = normalize_text(title or "")
+        normalized_abstract = normalize_text(abstract or "")
+        rejection, keyword_hits = self._screen(normalized_title, normalized_abstract) if staged else (None, None)
+        if rejection is None:
+            ratio_title = fuzz.partial_ratio(self.normalized_query, normalized_title) if normalized_title else 0
+            ratio_abstract = fuzz.partial_ratio(self.normalized_query, normalized_abstract) if normalized_abstract else 0
+            result = self._score(normalized_title, normalized_abstract, ratio_title, ratio_abstract, keyword_hits)
+        else:
+            result = rejection
+        self._count_stages([result])
+        return result
+
+    def evaluate_many(
+        self,
+        items: Iterable[Tuple[str, str]],
+        workers: int = -1,
+        staged: bool = False,
+    ) -> List[RelevanceResult]:
+        """Evaluate ``(title, abstract)`` pairs, typically a whole page of results.
+
+        The fuzzy ratios of every title and abstract are computed in a single
+        rapidfuzz ``cdist`` call spread over *workers* threads (all cores by
+        default); the results are identical to calling :meth:`evaluate` on
+        each pair with the same *staged* flag.
+        """
+
+        normalized = [(normalize_text(title or ""), normalize_text(abstract or "")) for title, abstract in items]
+        results: List[RelevanceResult | None] = [None] * len(normalized)
+        screened_hits: List[Set[str] | None] = [None] * len(normalized)
+        pending: List[int] = []
+        for position, (normalized_title, normalized_abstract) in enumerate(normalized):
+            if staged:
+                rejection, screened_hits[position] = self._screen(normalized_title, normalized_abstract)
+            else:
+                rejection = None
+            if rejection is None:
+                pending.append(position)
+            else:
+                results[position] = rejection
+
+        if pending:
+            texts = [text for position in pending for text in normalized[position]]
+            ratios = process.cdist(
+                [self.normalized_query],
+                texts,
+                scorer=fuzz.partial_ratio,
+                dtype=np.float64,
+                workers=workers,
+            )[0].tolist()
+            for offset, position in enumerate(pending):
+                normalized_title, normalized_abstract = normalized[position]
+                ratio_title = ratios[2 * offset] if normalized_title else 0
+                ratio_abstract = ratios[2 * offset + 1] if normalized_abstract else 0
+                results[position] = self._score(
+                    normalized_title,
+                    normalized_abstract,
+                    ratio_title,
+                    ratio_abstract,
+                    screened_hits[position],
+                )
+        self._count_stages(results)
+        return results
 
-    def evaluate(self, title: str, abstract: str) -> RelevanceResult:
-        normalized_title = _normalize(title or "")
-        normalized_abstract = _normalize(abstract or "")
-        combined_text = f"{normalized_title} {normalized_abstract}".strip()
-        text_for_keywords = normalized_abstract or combined_text
+    def _count_stages(self, results: Iterable[RelevanceResult]) -> None:
+        counts = Counter(result.stage for result in results)
+        with self._stage_lock:
+            self.stage_counts.update(counts)
+
+    def _screen(
+        self, normalized_title: str, normalized_abstract: str
+    ) -> Tuple[RelevanceResult | None, Set[str] | None]:
+        """Return a rejection when a mandatory keyword is missing, with the keyword hits.
+
+        That is the only check :meth:`should_keep` applies regardless of the
+        score: the other articles are either kept or held as fallback
+        candidates, and both are ranked by score. The hits (``None`` when
+        there is nothing to check) are handed to :meth:`_score` so that a
+        surviving article is not matched twice.
+        """
+
+        if not self.mandatory_keywords:
+            return None, None
+
+        # the keywords are looked up in the abstract, or the title without one
+        keyword_hits = self._matcher.find(normalized_abstract or normalized_title)
+        mandatory_missing = {label for label, terms in self.mandatory_keywords if keyword_hits.isdisjoint(terms)}
+        if not mandatory_missing:
+            return None, keyword_hits
+
+        return RelevanceResult(
+            score=0.0,
+            matched_groups=0,
+            title_only_groups=0,
+            matched_terms=keyword_hits,
+            matched_concepts=set(),
+            core_matches=0,
+            mandatory_missing=mandatory_missing,
+            mandatory_hits={label for label, _ in self.mandatory_keywords} - mandatory_missing,
+            optional_hits={label for label, terms in self.optional_keywords if not keyword_hits.isdisjoint(terms)},
+            stage="mandatory",
+        ), keyword_hits
+
+    def _score(
+        self,
+        normalized_title: str,
+        normalized_abstract: str,
+        ratio_title: float,
+        ratio_abstract: float,
+        keyword_hits: Set[str] | None = None,
+    ) -> RelevanceResult:
+        # without an abstract the keywords are looked up in the title alone;
+        # *keyword_hits* are those already found by _screen
+        if normalized_abstract:
+            abstract_hits = self._matcher.find(normalized_abstract) if keyword_hits is None else keyword_hits
+            title_hits = self._matcher.find(normalized_title)
+            keyword_hits = abstract_hits
+        else:
+            title_hits = self._matcher.find(normalized_title) if keyword_hits is None else keyword_hits
+            abstract_hits = set()
+            keyword_hits = title_hits
 
         matched_groups = 0
         title_only_groups = 0
@@ -360,22 +734,18 @@ class QueryRelevanceEngine:
         optional_hits: Set[str] = set()
 
         for label, terms in self.mandatory_keywords:
-            if text_for_keywords and any(term in text_for_keywords for term in terms):
-                mandatory_hits.add(label)
-            else:
+            if keyword_hits.isdisjoint(terms):
                 mandatory_missing.add(label)
+            else:
+                mandatory_hits.add(label)
 
         for label, terms in self.optional_keywords:
-            if text_for_keywords and any(term in text_for_keywords for term in terms):
+            if not keyword_hits.isdisjoint(terms):
                 optional_hits.add(label)
 
         for group in self.concept_groups:
-            abstract_hit = normalized_abstract and any(
-                term in normalized_abstract for term in group.terms
-            )
-            title_hit = normalized_title and any(
-                term in normalized_title for term in group.terms
-            )
+            abstract_hit = not abstract_hits.isdisjoint(group.terms)
+            title_hit = not title_hits.isdisjoint(group.terms)
 
             if abstract_hit:
                 matched_groups += 1
@@ -388,16 +758,8 @@ class QueryRelevanceEngine:
                 matched_concepts.add(group.name)
                 matched_weight += group.weight * 0.4
 
-        keyword_basis = text_for_keywords or combined_text
-        if keyword_basis:
-            matched_terms = self._matched_terms(keyword_basis)
-            keyword_coverage = (len(matched_terms) / len(self.keyword_terms) * 100) if self.keyword_terms else 0
-        else:
-            matched_terms = set()
-            keyword_coverage = 0
-
-        ratio_title = fuzz.partial_ratio(self.normalized_query, normalized_title) if normalized_title else 0
-        ratio_abstract = fuzz.partial_ratio(self.normalized_query, normalized_abstract) if normalized_abstract else 0
+        matched_terms = keyword_hits
+        keyword_coverage = (len(matched_terms) / len(self.keyword_terms) * 100) if self.keyword_terms else 0
 
         coverage_ratio = 0
         if self.total_concept_weight:
@@ -451,6 +813,42 @@ class QueryRelevanceEngine:
 
         return False
 
+    def query_weights(self) -> dict:
+        """Return ``{token: weight}`` for the inverted-index scoring modes.
+
+        Every token of a concept group's terms takes the group weight, the
+        highest one when a token belongs to several groups.
+        """
+
+        weights: dict = {}
+        for group in self.concept_groups:
+            for term in group.terms:
+                for token in term.split():
+                    weights[token] = max(weights.get(token, 0.0), group.weight)
+        return weights
+
+    def rank(
+        self,
+        index: ArticleIndex,
+        mode: str = "bm25",
+        limit: int | None = None,
+    ) -> List[Tuple[object, float]]:
+        """Rank the articles of *index* for this query, best first.
+
+        This is the BM25 / TF-IDF alternative to :meth:`evaluate`: it uses term
+        statistics across the indexed articles instead of fuzzy ratios, and
+        returns ``(article, score)`` pairs, at most *limit* of them.
+        """
+
+        scores = index.scores(self.query_weights(), mode=mode)
+        if limit is not None and limit < len(scores):
+            selected = np.argpartition(-scores, limit)[:limit]
+        else:
+            selected = np.arange(len(scores))
+        # stable on the index position, so equal scores keep the insertion order
+        order = selected[np.lexsort((selected, -scores[selected]))]
+        return [(index.articles[position], round(float(scores[position]), 4)) for position in order]
+
     def build_targeted_queries(
         self,
         max_groups: int = 3,
@@ -503,8 +901,8 @@ class QueryRelevanceEngine:
                 return
             if index == len(option_lists):
                 query = " ".join(current)
-                cleaned_query = _dedupe_tokens(query)
-                normalized = _normalize(cleaned_query)
+                cleaned_query = dedupe_tokens(query)
+                normalized = normalize_text(cleaned_query)
                 if normalized and normalized not in seen:
                     seen.add(normalized)
                     combinations.append(cleaned_query)
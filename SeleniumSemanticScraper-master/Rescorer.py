@@ -0,0 +1,170 @@
+"""Offline re-scoring of a saved search.
+
+The articles stored in ``Articles.pkl`` keep their title and synopsis, which
+is all :class:`QueryRelevanceEngine` needs. When the keyword rules of a search
+change, :class:`Rescorer` rebuilds the engine and re-evaluates the stored
+articles in place instead of querying Semantic Scholar again.
+
+With ``--rank bm25`` (or ``tfidf``) the score comes instead from ranking the
+stored articles against each other through an :class:`ArticleIndex`; the
+keyword checks and concepts still come from the engine.
+
+Usage::
+
+    python Rescorer.py "detection dog" --required chien --optional robot
+    python Rescorer.py "detection dog" --rank bm25
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+
+from Gerenciador import Gerenciador
+from RelevanceEngine import (
+    ArticleIndex,
+    QueryRelevanceEngine,
+    RelevanceResult,
+    build_translated_query,
+    prepare_keyword_constraints,
+)
+import Timer
+from activity_logger import log_event
+from text_normalizer import collapse_whitespace
+
+# below this many articles per worker, spawning processes costs more than it saves
+_MIN_CHUNK = 500
+
+RANK_MODES = ("bm25", "tfidf")
+
+
+def _evaluate_chunk(engine: QueryRelevanceEngine, pairs: List[Tuple[str, str]]) -> List[RelevanceResult]:
+    return engine.evaluate_many(pairs, workers=1)
+
+
+class Rescorer:
+    def __init__(self, search, root_directory):
+        self.search = collapse_whitespace(search or "")
+        self.root_directory = root_directory
+        self.manager = Gerenciador(self.search, self.root_directory)
+        self.relevance_engine = None
+
+    def build_engine(self, keyword_rules, translate=True) -> QueryRelevanceEngine:
+        """Build the engine the crawler would use for this search and *keyword_rules*."""
+
+        mandatory_keywords, optional_keywords = prepare_keyword_constraints(keyword_rules, translate=translate)
+        return QueryRelevanceEngine(
+            build_translated_query(self.search, translate=translate),
+            mandatory_keywords=mandatory_keywords,
+            optional_keywords=optional_keywords,
+        )
+
+    def evaluate(self, articles, workers=None) -> List[RelevanceResult]:
+        pairs = [(article.titulo, article.synopsis) for article in articles]
+        workers = workers or os.cpu_count() or 1
+        workers = min(workers, len(pairs) // _MIN_CHUNK)
+        if workers <= 1:
+            return self.relevance_engine.evaluate_many(pairs)
+
+        chunk_size = -(-len(pairs) // workers)
+        chunks = [pairs[start:start + chunk_size] for start in range(0, len(pairs), chunk_size)]
+        results: List[RelevanceResult] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_results in executor.map(_evaluate_chunk, [self.relevance_engine] * len(chunks), chunks):
+                results.extend(chunk_results)
+        return results
+
+    def rank(self, articles, mode):
+        """Score *articles* with the *mode* ranking and return them best first.
+
+        The BM25 and TF-IDF scores have no fixed scale, so they are divided
+        by the best one: the stored score stays between 0 and 100 like the
+        engine's, which the exporter relies on.
+        """
+
+        ranked = self.relevance_engine.rank(ArticleIndex(articles), mode=mode)
+        best = ranked[0][1] if ranked else 0.0
+        for article, score in ranked:
+            article.relevance_score = round(score / best * 100, 2) if best > 0 else 0.0
+        return [article for article, _ in ranked]
+
+    def rescore(self, keyword_rules, workers=None, translate=True, rank=None) -> Dict[str, int]:
+        """Re-evaluate the stored articles and save their new score and concepts.
+
+        The authors are saved again with the articles, so that both files
+        use the same record ids. Nothing is removed: articles that no longer satisfy
+        the mandatory keywords are only counted in the returned summary.
+        *rank*, one of :data:`RANK_MODES`, replaces the score as described
+        in :meth:`rank`.
+        """
+
+        if rank is not None and rank not in RANK_MODES:
+            raise ValueError(f"Mode de classement inconnu : {rank}")
+
+        start_time = Timer.timeNow()
+        self.relevance_engine = self.build_engine(keyword_rules, translate=translate)
+        articles = self.manager.loadArtigos()
+        authors = self.manager.loadAutores()
+
+        missing_mandatory = 0
+        for article, result in zip(articles, self.evaluate(articles, workers)):
+            article.relevance_score = result.score
+            article.concepts = sorted(result.matched_concepts or result.matched_terms)
+            if result.mandatory_missing:
+                missing_mandatory += 1
+        if rank is not None:
+            self.rank(articles, rank)
+
+        self.manager.saveArtigos(articles)
+        self.manager.saveAutores(authors)
+
+        summary = {
+            "articles": len(articles),
+            "missing_mandatory": missing_mandatory,
+        }
+        log_event(
+            "RESCORE_COMPLETE",
+            "Pertinence des articles enregistrés recalculée",
+            search=self.search,
+            rank=rank or "engine",
+            articles_path=self.manager.arquivo_artigos,
+            duration_seconds=Timer.totalTime(start_time, Timer.timeNow()).total_seconds(),
+            **summary,
+        )
+        return summary
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Recalcule la pertinence des articles d’une recherche enregistrée.")
+    parser.add_argument('search', help="phrase de recherche utilisée lors de la collecte")
+    parser.add_argument('--required', action='append', default=[], help="mot-clé indispensable (répétable)")
+    parser.add_argument('--optional', action='append', default=[], help="mot-clé facultatif (répétable)")
+    parser.add_argument('--workers', type=int, default=None, help="nombre de processus (tous les cœurs par défaut)")
+    parser.add_argument('--no-translate', action='store_true', help="n’ajoute pas les traductions anglaises")
+    parser.add_argument(
+        '--rank',
+        choices=RANK_MODES,
+        default=None,
+        help="classe les articles enregistrés par BM25 ou TF-IDF au lieu du score de l’évaluation",
+    )
+    args = parser.parse_args(argv)
+
+    keyword_rules = [{'term': term, 'importance': 'required'} for term in args.required]
+    keyword_rules += [{'term': term, 'importance': 'optional'} for term in args.optional]
+
+    rescorer = Rescorer(args.search, os.getcwd())
+    summary = rescorer.rescore(
+        keyword_rules,
+        workers=args.workers,
+        translate=not args.no_translate,
+        rank=args.rank,
+    )
+    print(
+        f"{summary['articles']} articles réévalués, "
+        f"{summary['missing_mandatory']} sans les mots-clés indispensables."
+    )
+
+
+if __name__ == "__main__":
+    main()
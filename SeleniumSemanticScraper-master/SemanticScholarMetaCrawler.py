@@ -1,22 +1,28 @@
 import os
-import re
 import sys
+import asyncio
 import datetime
+import json
+import queue
+import threading
 import time
-from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
 from typing import List, Dict, Optional
 
 import requests
 
-from Artigo import Artigo
+from Artigo import Artigo, article_identity
 from Autor import Autor
 from ExcelExporter import ExcelExporter
 from Gerenciador import Gerenciador
-from RelevanceEngine import QueryRelevanceEngine
+from RelevanceEngine import QueryRelevanceEngine, build_translated_query, prepare_keyword_constraints
 import Timer
-from TranslationHelper import build_text_variants
-from findQualis import find_similar_journal
+from findQualis import find_journal_by_issn, resolve_many
+from text_normalizer import collapse_whitespace, dedupe_tokens
 from NetworkHelper import configure_session_for_tor
+from TranslationHelper import build_text_variants
 from KeyLoader import (
     load_semantic_scholar_api_key,
     load_tor_proxy,
@@ -25,6 +31,130 @@ from KeyLoader import (
 )
 from TorIntegration import ensure_local_tor_proxy, request_new_tor_identity
 from activity_logger import log_event, log_exception
+from candidate_pool import CandidatePool
+from rate_limiter import semantic_scholar_limiter
+from response_cache import ResponseCache
+from async_client import (
+    INITIAL_BACKOFF,
+    MAX_ATTEMPTS,
+    MAX_BACKOFF,
+    REQUEST_TIMEOUT,
+    AsyncSemanticScholarClient,
+    EventLoopThread,
+    retry_after_seconds,
+)
+
+_SEARCH_ENDPOINT = 'https://api.semanticscholar.org/graph/v1/paper/search'
+_BULK_SEARCH_ENDPOINT = 'https://api.semanticscholar.org/graph/v1/paper/search/bulk'
+_BATCH_ENDPOINT = 'https://api.semanticscholar.org/graph/v1/paper/batch'
+_MATCH_ENDPOINT = 'https://api.semanticscholar.org/graph/v1/paper/search/match'
+# the searches only fetch what scoring and Qualis need; the authors and BibTeX
+# of the selected articles come from /paper/batch, which takes 500 ids at most
+_LIGHT_FIELDS = "abstract,citationCount,externalIds,paperId,publicationVenue,title,url,venue,year"
+_HEAVY_FIELDS = "authors,citationStyles"
+_BATCH_LIMIT = 500
+# /paper/batch also takes these external ids, for the results without a paperId
+_BATCH_EXTERNAL_IDS = (
+    ("DOI", "DOI"),
+    ("ArXiv", "ARXIV"),
+    ("CorpusId", "CorpusId"),
+    ("PubMed", "PMID"),
+    ("PubMedCentral", "PMCID"),
+    ("MAG", "MAG"),
+    ("ACL", "ACL"),
+)
+# /paper/search returns at most 100 results per request and 1000 per query
+_SEARCH_PAGE_LIMIT = 100
+_SEARCH_RESULT_WINDOW = 1000
+# share of a page's results that must be accepted to request the next page
+_MIN_PAGE_ACCEPTANCE = 0.05
+# strategies fetched at once; the shared rate limiter still paces their requests
+_STRATEGY_WORKERS = 4
+
+
+@dataclass
+class _StrategyPage:
+    number: int
+    offset: int
+    # the raw answer is not kept, only its size and the total the API reports
+    result_count: int
+    total: int
+    fresh_items: list
+    synopses: list
+    relevance_results: list
+    # where the strategy goes on from, None once it stopped after this page
+    next_offset: Optional[int] = None
+    kept: int = 0
+
+
+class _StrategyGate:
+    """Holds back the pages of a strategy that the earlier ones make useless.
+
+    The strategies are merged in list order, so a strategy's pages only
+    count once the strategies before it have been merged without filling the
+    pool. A strategy reads ahead only when the earlier strategies are
+    expected to fall short of the target; otherwise it waits for its turn,
+    or for the crawl to stop. Waiting never changes which pages a strategy
+    reads, only when it reads them.
+    """
+
+    def __init__(self, desired_results, expected):
+        self.stop = threading.Event()
+        self._desired_results = desired_results
+        # articles each strategy should keep by its end, None until its first page
+        self._expected = list(expected)
+        self._merged = 0
+        self._condition = threading.Condition()
+        # wake-up callbacks of the strategies waiting on the asyncio engine
+        self._async_waiters = []
+
+    def _may_fetch(self, index):
+        if index <= self._merged + 1:
+            return True
+        earlier = self._expected[: index - 1]
+        return None not in earlier and sum(earlier) < self._desired_results
+
+    def wait_turn(self, index):
+        """Block until strategy *index* may send its next request; false once the crawl stopped."""
+
+        with self._condition:
+            self._condition.wait_for(lambda: self.stop.is_set() or self._may_fetch(index))
+        return not self.stop.is_set()
+
+    async def wait_turn_async(self, index):
+        """Coroutine version of :meth:`wait_turn`, for the asyncio network engine."""
+
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self.stop.is_set() or self._may_fetch(index):
+                    return not self.stop.is_set()
+                woken = asyncio.Event()
+                self._async_waiters.append(lambda: loop.call_soon_threadsafe(woken.set))
+            await woken.wait()
+
+    def _notify(self):
+        # called with the condition held
+        self._condition.notify_all()
+        waiters, self._async_waiters = self._async_waiters, []
+        for wake in waiters:
+            wake()
+
+    def report(self, index, expected):
+        with self._condition:
+            self._expected[index - 1] = expected
+            self._notify()
+
+    def merged(self, index):
+        with self._condition:
+            self._merged = index
+            self._notify()
+
+    def close(self):
+        with self._condition:
+            self.stop.set()
+            self._notify()
+
 
 class Crawler:
     def __init__(self, root_directory):
@@ -42,6 +172,9 @@ class Crawler:
         self.input_pages = 0
         self.year_filter_choice: Optional[int] = None
         self.keyword_rules: List[Dict[str, str]] = []
+        self.bulk_mode = False
+        self.refresh_cache = False
+        self.async_engine = False
 
         self.gui = None
         self.relevance_engine = None
@@ -67,6 +200,9 @@ class Crawler:
                 "d’environnement correspondante pour augmenter les quotas.",
             )
             log_event("CONFIG", "Aucune clé API Semantic Scholar configurée")
+        # shared by every thread of a crawl
+        self._rate_limiter = semantic_scholar_limiter(self.api_key_active)
+        self._response_cache = ResponseCache()
 
         tor_browser_path = load_tor_browser_path()
         if tor_browser_path:
@@ -119,7 +255,7 @@ class Crawler:
             )
             log_event("TOR_USAGE", "Aucun proxy Tor détecté")
 
-    def update_search_parameters(self, input_search, input_pages, year_filter, keyword_rules):
+    def update_search_parameters(self, input_search, input_pages, year_filter, keyword_rules, bulk=False, refresh=False, async_engine=False):
         normalized_search = self._normalize_search_phrase(input_search)
         if normalized_search != (input_search or ""):
             log_event(
@@ -132,6 +268,11 @@ class Crawler:
         self.input_pages = input_pages
         self.year_filter_choice = self._map_year_filter(year_filter)
         self.keyword_rules = keyword_rules or []
+        self.bulk_mode = bool(bulk)
+        # a refresh skips the cached answers but still stores the new ones
+        self.refresh_cache = bool(refresh)
+        # the strategies run as asyncio tasks instead of on the thread pool
+        self.async_engine = bool(async_engine)
         log_event(
             "CRAWLER_CONFIG",
             "Paramètres de recherche mis à jour",
@@ -139,6 +280,9 @@ class Crawler:
             pages=self.input_pages,
             year_filter=self.year_filter_choice,
             keywords=self.keyword_rules,
+            bulk=self.bulk_mode,
+            refresh=self.refresh_cache,
+            async_engine=self.async_engine,
         )
 
     def _map_year_filter(self, year_filter) -> Optional[int]:
@@ -172,16 +316,10 @@ class Crawler:
         return f"{start_year}-"
 
     def _normalize_search_phrase(self, value: Optional[str]) -> str:
-        return re.sub(r"\s+", " ", (value or "").strip())
+        return collapse_whitespace(value or "")
 
     def _dedupe_tokens(self, text: str) -> str:
-        tokens = [token for token in re.split(r"\s+", text.strip()) if token]
-        deduped: List[str] = []
-        for token in tokens:
-            if deduped and token.lower() == deduped[-1].lower():
-                continue
-            deduped.append(token)
-        return " ".join(deduped)
+        return dedupe_tokens(text)
 
     def _describe_standard_strategy(self) -> str:
         if not self.year_filter_choice:
@@ -208,58 +346,19 @@ class Crawler:
         return self.year_filter_choice > years
 
     def _build_translated_query(self, text: str) -> str:
-        variants = list(build_text_variants(text or ""))
-        if not variants:
-            return ""
-        joined = " ".join(variants)
-        cleaned = self._dedupe_tokens(joined)
-        log_event(
-            "QUERY_VARIANTS",
-            "Requête enrichie avec variantes",
-            original=text,
-            variants=variants,
-            normalized=cleaned,
-        )
-        return cleaned
+        return build_translated_query(text)
 
     def _prepare_keyword_constraints(self):
-        mandatory = []
-        optional = []
-
-        for keyword in self.keyword_rules:
-            term = (keyword.get('term') or '').strip()
-            if not term:
-                continue
-
-            variants = list(build_text_variants(term))
-            if not variants:
-                continue
-
-            entry = {
-                'label': term,
-                'forms': variants,
-                'display_terms': set(variants),
-            }
-            log_event(
-                "KEYWORD_VARIANTS",
-                "Critère enrichi",
-                original=term,
-                variants=variants,
-                importance=keyword.get('importance'),
-            )
+        return prepare_keyword_constraints(self.keyword_rules)
 
-            if keyword.get('importance') == 'required':
-                mandatory.append(entry)
-            else:
-                optional.append(entry)
+    def _extract_issns(self, item) -> List[str]:
+        venue = item.get("publicationVenue") or {}
+        issns = [venue.get("issn"), *(venue.get("alternate_issns") or [])]
+        return [issn for issn in issns if issn]
 
-        log_event(
-            "KEYWORD_SUMMARY",
-            "Résumé des contraintes de mots-clés",
-            mandatory=len(mandatory),
-            optional=len(optional),
-        )
-        return mandatory, optional
+    def _clean_abstract(self, abstract: Optional[str]) -> str:
+        synopsis = abstract.replace(" Expand", "") if abstract else "Aucun résumé"
+        return synopsis.replace("TLDR\n", "")
 
     # extract the type of the article from the BibText cite text and returns it as a single word string
     # TODO: extract it from "publicationTypes" attribute
@@ -286,13 +385,7 @@ class Crawler:
         self.list_articles = set(self.manager.loadArtigos())
 
         existing_articles = len(self.list_articles)
-        existing_keys = {
-            (
-                (article.titulo or "").strip().lower(),
-                (article.link or "").strip().lower(),
-            )
-            for article in self.list_articles
-        }
+        existing_keys = {article.identity for article in self.list_articles}
         author_lookup = {
             (author.nome, author.link): author for author in self.list_authors
         }
@@ -307,13 +400,12 @@ class Crawler:
             )
         article_limit = max(1, int(self.input_pages))
         desired_results = article_limit
-        _articles_endpoint = 'https://api.semanticscholar.org/graph/v1/paper/search'
 
         base_query_params = {
             "query": _search_query,
-            "fields": "abstract,authors,citationCount,citationStyles,title,url,venue,year",
+            "fields": _LIGHT_FIELDS,
             "offset": 0,
-            "limit": article_limit,
+            "limit": min(article_limit, _SEARCH_PAGE_LIMIT),
         }
         log_event(
             "CRAWLER_QUERY",
@@ -332,6 +424,279 @@ class Crawler:
             mandatory_keywords=mandatory_keywords,
             optional_keywords=optional_keywords,
         )
+        if self.bulk_mode:
+            collected = self._collect_bulk_candidates(base_query_params, existing_keys, desired_results)
+        else:
+            collected = self._collect_strategy_candidates(
+                base_query_params, existing_keys, desired_results
+            )
+        if collected is None:
+            return
+        accepted_candidates, fallback_candidates, responses_received = collected
+
+        selected_candidates = accepted_candidates.ranked()[:desired_results]
+
+        if len(selected_candidates) < desired_results and fallback_candidates:
+            remaining = desired_results - len(selected_candidates)
+            selected_candidates.extend(fallback_candidates.ranked()[:remaining])
+            log_event(
+                "CRAWLER_SELECTION",
+                "Ajout de candidats de secours",
+                remaining=remaining,
+            )
+
+        selected_candidates = selected_candidates[:desired_results]
+
+        try:
+            self._fetch_heavy_fields(selected_candidates, author_lookup)
+        except requests.RequestException as exc:
+            print("Failed to reach Semantic Scholar API:", exc, file=sys.stderr)
+            log_exception(
+                "CRAWLER_REQUEST_ERROR",
+                "Erreur lors de l’interrogation de Semantic Scholar",
+                exc,
+                description="Détails des articles retenus",
+            )
+            self.gui.show_search_failed_alert(self._format_request_error(exc))
+            return
+
+        self.list_authors = set(self.list_authors)
+
+        for article, _, _ in selected_candidates:
+            key = self._article_key(article)
+            if key in existing_keys:
+                continue
+
+            existing_keys.add(key)
+            # registering the article gives it and its new authors their ids
+            article = self.manager.registry.add_article(article)
+            self.list_articles.add(article)
+            for author in article.autores:
+                if author not in self.list_authors:
+                    self.list_authors.add(author)
+                author.addArtigo(article)
+
+        self.end_time = Timer.timeNow()
+
+        # the crawl went through, nothing is left to resume
+        self.manager.removeCheckpoint()
+
+        total_added = len(self.list_articles) - existing_articles
+        if responses_received == 0 or total_added <= 0:
+            self.gui.show_search_failed_alert(
+                f"Aucun nouvel article n’a été trouvé pour « {self.input_search} ». Modifiez la requête ou réessayez ultérieurement."
+            )
+            log_event(
+                "CRAWLER_EMPTY",
+                "Aucun nouvel article trouvé",
+                query=self.input_search,
+                responses=responses_received,
+            )
+            return
+
+        self.list_articles = list(self.list_articles)
+        self.list_authors = list(self.list_authors)
+
+        self.manager.saveArtigos(self.list_articles)
+        self.manager.saveAutores(self.list_authors)
+        log_event(
+            "CRAWLER_STORAGE",
+            "Résultats sauvegardés",
+            articles_path=self.manager.arquivo_artigos,
+            authors_path=self.manager.arquivo_autores,
+            total_articles=len(self.list_articles),
+            total_authors=len(self.list_authors),
+        )
+
+        self.gui.show_search_done_alert(
+            Timer.totalTime(self.start_time, self.end_time),
+            str(total_added),
+        )
+        log_event(
+            "CRAWLER_COMPLETE",
+            "Recherche terminée",
+            total_articles=len(self.list_articles),
+            added=total_added,
+            duration_seconds=Timer.totalTime(self.start_time, self.end_time).seconds,
+        )
+
+    @staticmethod
+    def _article_key(article: Artigo) -> str:
+        return article.identity
+
+    @staticmethod
+    def _item_key(item: dict) -> str:
+        # same key as _article_key for the Artigo built from this item
+        return article_identity(item.get("paperId"), item.get("externalIds"), item["title"], item["url"] or "-")
+
+    def _build_article(self, item, synopsis, qualis_score, relevance_result):
+        """Return the ``Artigo`` for a search result, without its authors and BibTeX yet.
+
+        The search requests only ask for the fields needed to score an
+        article; :meth:`_fetch_heavy_fields` completes the selected ones.
+        """
+
+        title = item["title"]
+
+        _venue = item["venue"]
+        origin = _venue if _venue else "-"
+
+        _year = item["year"]
+        date = str(_year) if _year else "0"
+
+        _citationCount = item["citationCount"]
+        citationCount = str(int(_citationCount if _citationCount else "0"))
+
+        _url = item["url"]
+        link = _url if _url else "-"
+
+        new_article = Artigo(
+            title,
+            [],
+            origin,
+            date,
+            citationCount,
+            link,
+            '-',
+            '-',
+            synopsis,
+            qualis_score,
+            paper_id=item.get("paperId"),
+            external_ids=item.get("externalIds"),
+        )
+
+        new_article.relevance_score = relevance_result.score
+        concepts_to_store = relevance_result.matched_concepts or relevance_result.matched_terms
+        new_article.concepts = sorted(concepts_to_store)
+
+        return new_article
+
+    def _complete_article(self, article, paper, author_lookup):
+        """Set the authors and BibTeX of *article* from its /paper/batch entry, reusing known ``Autor`` objects."""
+
+        list_authors_in_article: List[Autor] = []
+        seen_authors = set()
+
+        for temp in paper.get("authors") or []:
+            name = temp["name"]
+            link = None
+            author_key = (name, link)
+            author = author_lookup.get(author_key)
+            if author is None:
+                author = Autor(name, link)
+                author_lookup[author_key] = author
+            if author not in seen_authors:
+                list_authors_in_article.append(author)
+                seen_authors.add(author)
+
+        list_authors_in_article.sort()
+        article.autores = list_authors_in_article
+
+        _citationStyles = paper.get("citationStyles")
+        _bibtex = _citationStyles["bibtex"] if _citationStyles else _citationStyles
+        if _bibtex:
+            article.bibtex = _bibtex
+            article.cite = self.return_type_cite(_bibtex)
+
+    @staticmethod
+    def _batch_identifier(article, paper_id):
+        """Return the id /paper/batch knows *article* by, or ``None`` when it has none."""
+
+        if paper_id:
+            return paper_id
+        # the paperId read from a Semantic Scholar link
+        if article.identity.startswith("s2:"):
+            return article.identity[len("s2:"):]
+        for field, prefix in _BATCH_EXTERNAL_IDS:
+            value = article.external_ids.get(field)
+            if value:
+                return f"{prefix}:{value}"
+        return None
+
+    def _fetch_heavy_fields(self, selected_candidates, author_lookup):
+        """Complete the selected articles with their authors and BibTeX, 500 papers per request.
+
+        Articles that /paper/batch cannot resolve are looked up one by one
+        from their title.
+        """
+
+        pending = []
+        unresolved = []
+        for article, paper_id, _ in selected_candidates:
+            identifier = self._batch_identifier(article, paper_id)
+            if identifier:
+                pending.append((article, identifier))
+            else:
+                unresolved.append(article)
+        for start in range(0, len(pending), _BATCH_LIMIT):
+            chunk = pending[start:start + _BATCH_LIMIT]
+            papers = self._perform_semantic_scholar_request(
+                _BATCH_ENDPOINT,
+                {"fields": _HEAVY_FIELDS},
+                json_body={"ids": [identifier for _, identifier in chunk]},
+                request_details={
+                    "description": "Détails des articles retenus",
+                    "papers": len(chunk),
+                },
+            )
+            if not isinstance(papers, list):
+                papers = []
+            for index, (article, _) in enumerate(chunk):
+                # unknown identifiers come back as null
+                paper = papers[index] if index < len(papers) else None
+                if paper:
+                    self._complete_article(article, paper, author_lookup)
+                else:
+                    unresolved.append(article)
+        for article in unresolved:
+            self._match_heavy_fields(article, author_lookup)
+        log_event(
+            "CRAWLER_DETAILS",
+            "Auteurs et BibTeX récupérés pour les articles retenus",
+            papers=len(pending),
+            requests=-(-len(pending) // _BATCH_LIMIT) + len(unresolved),
+            by_title=len(unresolved),
+        )
+
+    def _match_heavy_fields(self, article, author_lookup):
+        """Complete *article* from the paper whose title matches its own, if Semantic Scholar has one."""
+
+        try:
+            answer = self._perform_semantic_scholar_request(
+                _MATCH_ENDPOINT,
+                {"query": article.titulo, "fields": "title," + _HEAVY_FIELDS},
+                request_details={
+                    "description": "Détails d’un article sans identifiant",
+                    "title": article.titulo,
+                },
+            )
+        except requests.HTTPError as exc:
+            # the endpoint answers 404 when no title matches
+            if exc.response is None or exc.response.status_code != 404:
+                raise
+            answer = None
+
+        matches = answer.get("data") if isinstance(answer, dict) else None
+        paper = matches[0] if matches else None
+        title = collapse_whitespace(article.titulo).casefold()
+        # the closest title is returned even when it belongs to another paper
+        if paper and collapse_whitespace(paper.get("title") or "").casefold() == title:
+            self._complete_article(article, paper, author_lookup)
+            return
+        log_event(
+            "CRAWLER_DETAILS",
+            "Auteurs et BibTeX introuvables pour un article retenu",
+            title=article.titulo,
+            link=article.link,
+        )
+
+    def _collect_strategy_candidates(self, base_query_params, existing_keys, desired_results):
+        """Run the relevance-ranked search strategies page by page.
+
+        Returns ``(accepted, fallback, responses)``, or ``None`` once a request
+        failure has been reported to the user.
+        """
+
         targeted_queries = self.relevance_engine.build_targeted_queries()
         log_event(
             "CRAWLER_TARGETS",
@@ -372,16 +737,14 @@ class Crawler:
             )
 
         search_strategies.append(("Requête orientée revue de littérature", {"query_suffix": "review"}))
-        accepted_candidates = {}
-        fallback_candidates = {}
-
-        responses_received = 0
+        strategy_params = [self._strategy_query_params(base_query_params, extra) for _, extra in search_strategies]
 
-        def normalize_key(article: Artigo) -> tuple[str, str]:
-            return (
-                (article.titulo or "").strip().lower(),
-                (article.link or "").strip().lower(),
-            )
+        checkpoint = self._load_checkpoint(search_strategies, strategy_params, desired_results)
+        accepted_candidates = checkpoint["accepted"]
+        fallback_candidates = checkpoint["fallback"]
+        progress = checkpoint["progress"]
+        # a checkpoint is only written once a page is merged, so a resumed one has progress
+        checkpoint_saved = bool(progress)
 
         log_event(
             "CRAWLER_STRATEGIES",
@@ -389,55 +752,185 @@ class Crawler:
             strategies=[description for description, _ in search_strategies],
         )
 
-        for index, (description, extra) in enumerate(search_strategies, start=1):
-            if self.gui is not None:
-                self.gui.notify_strategy_started(description, index, len(search_strategies))
-
-            query_params = dict(base_query_params)
-            if "query_override" in extra:
-                query_params["query"] = extra["query_override"]
-                extra_params = {k: v for k, v in extra.items() if k not in {"query_override"}}
-            elif "query_suffix" in extra:
-                query_params["query"] = re.sub(
-                    r"\s+",
-                    " ",
-                    f"{query_params['query']} {extra['query_suffix']}".strip(),
-                )
-                extra_params = {k: v for k, v in extra.items() if k != "query_suffix"}
-            else:
-                extra_params = extra
-            query_params.update(extra_params)
-            if query_params.get("query"):
-                query_params["query"] = self._dedupe_tokens(str(query_params["query"]))
-
-            try:
-                articles_res = self._perform_semantic_scholar_request(
-                    _articles_endpoint,
+        # the strategies are fetched concurrently but merged in list order, so the
+        # candidates kept do not depend on which request happens to answer first;
+        # each page is merged as soon as its turn comes, then dropped
+        gate = _StrategyGate(
+            desired_results,
+            [
+                # a finished strategy is merged before any other can wait on it
+                0 if index in progress and progress[index] is None else None
+                for index in range(1, len(search_strategies) + 1)
+            ],
+        )
+        sinks = [queue.SimpleQueue() for _ in search_strategies]
+        # the pool may have been filled by the last page merged before the interruption
+        pool_full = len(accepted_candidates) >= desired_results
+        with self._strategy_runner(len(search_strategies), gate) as submit:
+            futures = [
+                # a strategy finished before the checkpoint is not run again
+                None if pool_full or progress.get(index, ()) is None else submit(
+                    index,
+                    len(search_strategies),
+                    description,
                     query_params,
-                    request_details={
-                        "description": description,
-                        "params": dict(query_params),
-                        "strategy_index": index,
-                    },
-                )
-            except requests.RequestException as exc:
-                error_message = self._format_request_error(exc)
-                print(
-                    "Failed to reach Semantic Scholar API:",
-                    exc,
-                    file=sys.stderr,
+                    existing_keys,
+                    desired_results,
+                    gate,
+                    progress.get(index),
+                    sink,
                 )
-                log_exception(
-                    "CRAWLER_REQUEST_ERROR",
-                    "Erreur lors de l’interrogation de Semantic Scholar",
-                    exc,
-                    description=description,
-                    params=query_params,
+                for index, ((description, _), query_params, sink) in enumerate(
+                    zip(search_strategies, strategy_params, sinks), start=1
                 )
-                self.gui.show_search_failed_alert(error_message)
-                return
+            ]
+            for future, sink in zip(futures, sinks):
+                if future is not None:
+                    # the end of a strategy, successful or not, follows its last page
+                    future.add_done_callback(lambda _, sink=sink: sink.put(None))
+
+            for index, ((description, _), future, sink) in enumerate(zip(search_strategies, futures, sinks), start=1):
+                if future is None:
+                    gate.merged(index)
+                    continue
+
+                for page in iter(sink.get, None):
+                    checkpoint["responses"] += 1
+                    checkpoint["known"] += page.result_count - len(page.fresh_items)
+                    self._merge_strategy_page(
+                        description,
+                        page,
+                        accepted_candidates,
+                        fallback_candidates,
+                        desired_results,
+                    )
+                    progress[index] = None if page.next_offset is None else (page.number + 1, page.next_offset, page.kept)
+                    self.manager.saveCheckpoint(checkpoint)
+                    checkpoint_saved = True
+                    if len(accepted_candidates) >= desired_results:
+                        break
+
+                if len(accepted_candidates) >= desired_results:
+                    break
+
+                try:
+                    future.result()
+                except requests.RequestException as exc:
+                    error_message = self._format_request_error(exc)
+                    print(
+                        "Failed to reach Semantic Scholar API:",
+                        exc,
+                        file=sys.stderr,
+                    )
+                    log_exception(
+                        "CRAWLER_REQUEST_ERROR",
+                        "Erreur lors de l’interrogation de Semantic Scholar",
+                        exc,
+                        description=description,
+                        checkpoint=self.manager.arquivo_checkpoint,
+                    )
+                    if checkpoint_saved:
+                        error_message += " La progression a été enregistrée : relancez la même recherche pour reprendre."
+                    self.gui.show_search_failed_alert(error_message)
+                    return None
+                gate.merged(index)
+
+        log_event(
+            "RELEVANCE_STAGES",
+            "Sorties de l’évaluation de pertinence par étape",
+            known=checkpoint["known"],
+            **self.relevance_engine.stage_counts,
+        )
+
+        return accepted_candidates, fallback_candidates, checkpoint["responses"]
 
-            responses_received += 1
+    def _load_checkpoint(self, search_strategies, strategy_params, desired_results):
+        """Return the saved progress of this exact crawl, or a fresh one.
+
+        ``progress`` maps a strategy's index to ``(page, offset, kept)`` for
+        its next page, or to ``None`` once it is finished. The candidates
+        already merged are kept in the checkpoint; the raw pages are not,
+        since the response cache holds them.
+        """
+
+        signature = json.dumps(
+            [desired_results, self.keyword_rules, [description for description, _ in search_strategies], strategy_params],
+            sort_keys=True,
+            default=str,
+        )
+        checkpoint = self.manager.loadCheckpoint()
+        if (
+            checkpoint is not None
+            and checkpoint.get("signature") == signature
+            and isinstance(checkpoint.get("accepted"), CandidatePool)
+        ):
+            log_event(
+                "CRAWLER_CHECKPOINT",
+                "Reprise de la collecte depuis le point de sauvegarde",
+                path=self.manager.arquivo_checkpoint,
+                accepted=len(checkpoint["accepted"]),
+                fallback=len(checkpoint["fallback"]),
+                finished=sorted(index for index, state in checkpoint["progress"].items() if state is None),
+            )
+            return checkpoint
+        if checkpoint is not None:
+            log_event(
+                "CRAWLER_CHECKPOINT",
+                "Point de sauvegarde ignoré : paramètres de recherche différents",
+                path=self.manager.arquivo_checkpoint,
+            )
+        return {
+            "signature": signature,
+            "progress": {},
+            "accepted": CandidatePool(desired_results),
+            "fallback": CandidatePool(desired_results),
+            "responses": 0,
+            "known": 0,
+        }
+
+    def _strategy_query_params(self, base_query_params, extra):
+        query_params = dict(base_query_params)
+        if "query_override" in extra:
+            query_params["query"] = extra["query_override"]
+            extra_params = {k: v for k, v in extra.items() if k not in {"query_override"}}
+        elif "query_suffix" in extra:
+            query_params["query"] = collapse_whitespace(f"{query_params['query']} {extra['query_suffix']}")
+            extra_params = {k: v for k, v in extra.items() if k != "query_suffix"}
+        else:
+            extra_params = extra
+        query_params.update(extra_params)
+        if query_params.get("query"):
+            query_params["query"] = self._dedupe_tokens(str(query_params["query"]))
+        return query_params
+
+    def _paginate_strategy(
+        self, index, total, description, query_params, existing_keys, desired_results, gate, resume, sink
+    ):
+        """Page through one strategy, screening each page as it arrives.
+
+        This generator yields ``(params, request_details)`` for each page to
+        fetch and is sent the decoded answer, so the blocking and asyncio
+        engines drive it the same way. Each screened page is put on *sink*
+        right away, for the main thread to merge. Whether to read another
+        page is decided from this strategy's own results, never from the
+        other strategies, so a strategy always produces the same pages for
+        the same answers of the API. *resume* is the ``(page, offset, kept)``
+        state saved in a checkpoint, or ``None``.
+        """
+
+        if self.gui is not None:
+            self.gui.notify_strategy_started(description, index, total)
+
+        page_size = query_params["limit"]
+        page_number, offset, kept = resume or (1, 0, 0)
+        while not gate.stop.is_set():
+            page_params = dict(query_params, offset=offset)
+            articles_res = yield page_params, {
+                "description": description if page_number == 1 else f"{description} (page {page_number})",
+                "params": dict(page_params),
+                "strategy_index": index,
+                "page": page_number,
+            }
 
             data = articles_res.get("data")
             if not isinstance(data, list):
@@ -452,223 +945,412 @@ class Crawler:
                     keys=list(articles_res.keys()),
                 )
 
-            previous_total = len(accepted_candidates)
-
-            for item in data:
-                title = item["title"]
-                _paper_authors = item["authors"]
-
-                list_authors_in_article: List[Autor] = []
-                seen_authors = set()
-
-                for temp in _paper_authors:
-                    name = temp["name"]
-                    link = None
-                    author_key = (name, link)
-                    author = author_lookup.get(author_key)
-                    if author is None:
-                        author = Autor(name, link)
-                        author_lookup[author_key] = author
-                    if author not in seen_authors:
-                        list_authors_in_article.append(author)
-                        seen_authors.add(author)
-
-                list_authors_in_article.sort()
-
-                _venue = item["venue"]
-                origin = _venue if _venue else "-"
-
-                _year = item["year"]
-                date = str(_year) if _year else "0"
-
-                _citationCount = item["citationCount"]
-                citationCount = str(int(_citationCount if _citationCount else "0"))
-
-                _url = item["url"]
-                link = _url if _url else "-"
-
-                _citationStyles = item["citationStyles"]
-                _bibtex = _citationStyles["bibtex"] if _citationStyles else _citationStyles
-                bibtex = '-'
-                cite = '-'
-                if _bibtex:
-                    bibtex = _bibtex
-                    cite = self.return_type_cite(bibtex)
-
-                _abstract = item["abstract"]
-                synopsis = _abstract.replace(" Expand", "") if _abstract else "Aucun résumé"
-                synopsis = synopsis.replace("TLDR\n", "")
-
-                qualis_score = find_similar_journal(target_text=origin)
-
-                new_article = Artigo(
-                    title,
-                    list_authors_in_article,
-                    origin,
-                    date,
-                    citationCount,
-                    link,
-                    cite,
-                    bibtex,
-                    synopsis,
-                    qualis_score,
-                )
+            # articles already stored for this search are skipped before any scoring
+            fresh_items = [item for item in data if self._item_key(item) not in existing_keys]
+            synopses = [self._clean_abstract(item["abstract"]) for item in fresh_items]
+            relevance_results = self.relevance_engine.evaluate_many(
+                ((item["title"], synopsis) for item, synopsis in zip(fresh_items, synopses)),
+                staged=True,
+            )
+            page = _StrategyPage(
+                page_number,
+                offset,
+                len(data),
+                articles_res.get("total", len(data)) or len(data),
+                fresh_items,
+                synopses,
+                relevance_results,
+            )
 
-                relevance_result = self.relevance_engine.evaluate(title, synopsis)
-                new_article.relevance_score = relevance_result.score
-                concepts_to_store = relevance_result.matched_concepts or relevance_result.matched_terms
-                new_article.concepts = sorted(concepts_to_store)
+            page_kept = 0
+            for relevance_result in relevance_results:
+                if self.relevance_engine.should_keep(relevance_result, kept, desired_results):
+                    kept += 1
+                    page_kept += 1
+
+            next_offset = articles_res.get("next")
+            if (
+                kept >= desired_results
+                or not data
+                or next_offset is None
+                or next_offset + page_size > _SEARCH_RESULT_WINDOW
+            ):
+                next_offset = None
+            # the first page of a strategy is always read; later ones must keep paying off
+            elif page_number > 1 and page_kept / len(data) < _MIN_PAGE_ACCEPTANCE:
+                log_event(
+                    "CRAWLER_PAGINATION",
+                    "Pages suivantes abandonnées : taux d’acceptation trop faible",
+                    description=description,
+                    page=page_number,
+                    acceptance_rate=round(page_kept / len(data), 3),
+                )
+                next_offset = None
+            page.next_offset = next_offset
+            page.kept = kept
+            # the pages left are assumed to keep as many articles as this one
+            remaining_pages = 0
+            if next_offset is not None:
+                remaining_pages = -(-(min(page.total, _SEARCH_RESULT_WINDOW) - next_offset) // page_size)
+            gate.report(index, kept + page_kept * max(remaining_pages, 0))
+            sink.put(page)
+            if next_offset is None:
+                break
+            offset = next_offset
+            page_number += 1
 
-                key = normalize_key(new_article)
-                if key in existing_keys:
-                    continue
+    def _fetch_strategy_pages(
+        self, index, total, description, query_params, existing_keys, desired_results, gate, resume, sink
+    ):
+        """Run :meth:`_paginate_strategy` with blocking requests, in a worker thread."""
 
-                if key in accepted_candidates:
-                    if accepted_candidates[key][0].relevance_score >= new_article.relevance_score:
-                        continue
+        pagination = self._paginate_strategy(
+            index, total, description, query_params, existing_keys, desired_results, gate, resume, sink
+        )
+        try:
+            params, details = next(pagination)
+            while gate.wait_turn(index):
+                response = self._perform_semantic_scholar_request(
+                    _SEARCH_ENDPOINT, params, request_details=details, stop=gate.stop
+                )
+                if response is None:
+                    # the crawl stopped while this request waited for the rate limiter
+                    return
+                params, details = pagination.send(response)
+        except StopIteration:
+            return
 
-                if key in fallback_candidates:
-                    if fallback_candidates[key][0].relevance_score >= new_article.relevance_score:
-                        continue
+    async def _fetch_strategy_pages_async(
+        self, client, index, total, description, query_params, existing_keys, desired_results, gate, resume, sink
+    ):
+        """Run :meth:`_paginate_strategy` on the asyncio engine."""
 
-                current_count = len(accepted_candidates)
-                if self.relevance_engine.should_keep(relevance_result, current_count, desired_results):
-                    accepted_candidates[key] = (new_article, list_authors_in_article, relevance_result)
-                    log_event(
-                        "CRAWLER_ACCEPTED",
-                        "Article retenu selon les critères",
-                        title=title,
-                        link=link,
-                        score=relevance_result.score,
-                        mandatory_hits=sorted(relevance_result.mandatory_hits),
-                        optional_hits=sorted(relevance_result.optional_hits),
-                        optional_count=len(relevance_result.optional_hits),
-                        title_only_groups=relevance_result.title_only_groups,
-                    )
-                else:
-                    if relevance_result.mandatory_missing:
-                        log_event(
-                            "CRAWLER_REJECTED",
-                            "Article rejeté : critères obligatoires manquants",
-                            title=title,
-                            link=link,
-                            score=relevance_result.score,
-                            missing=sorted(relevance_result.mandatory_missing),
-                        )
-                        continue
-                    fallback_candidates[key] = (new_article, list_authors_in_article, relevance_result)
-                    log_event(
-                        "CRAWLER_FALLBACK",
-                        "Article conservé pour analyse ultérieure",
-                        title=title,
-                        link=link,
-                        score=relevance_result.score,
-                        mandatory_hits=sorted(relevance_result.mandatory_hits),
-                        optional_hits=sorted(relevance_result.optional_hits),
-                        optional_count=len(relevance_result.optional_hits),
-                        title_only_groups=relevance_result.title_only_groups,
-                    )
+        pagination = self._paginate_strategy(
+            index, total, description, query_params, existing_keys, desired_results, gate, resume, sink
+        )
+        try:
+            params, details = next(pagination)
+            while await gate.wait_turn_async(index):
+                response = await client.request(_SEARCH_ENDPOINT, params, request_details=details)
+                params, details = pagination.send(response)
+        except StopIteration:
+            return
 
-            new_items = len(accepted_candidates) - previous_total
-            total_items = articles_res.get("total", len(data)) or len(data)
+    @contextmanager
+    def _strategy_runner(self, strategy_count, gate):
+        """Yield a ``submit(*strategy)`` function returning a future that completes with the strategy.
+
+        The blocking engine runs the strategies on a bounded thread pool; the
+        asyncio engine runs them all as tasks of one event loop, its client
+        bounding the requests in flight. Either way, leaving the block stops
+        the strategies still running: threads after their current request,
+        tasks right away.
+        """
+
+        if self.async_engine:
+            with EventLoopThread() as loop_thread:
+                client = AsyncSemanticScholarClient(
+                    headers={"x-api-key": self._session.headers["x-api-key"]} if self.api_key_active else None,
+                    proxy=self._session.proxies.get("https") or self._session.proxies.get("http"),
+                    limiter=self._rate_limiter,
+                    cache=self._response_cache,
+                    refresh=self.refresh_cache,
+                    gui=self.gui,
+                )
+                loop_thread.run(client.open())
+                try:
+                    yield lambda *strategy: loop_thread.submit(self._fetch_strategy_pages_async(client, *strategy))
+                finally:
+                    gate.close()
+                    loop_thread.run(loop_thread.cancel_pending())
+                    loop_thread.run(client.aclose())
+            return
 
-            if self.gui is not None:
-                self.gui.notify_strategy_results(description, new_items, total_items)
+        executor = ThreadPoolExecutor(
+            max_workers=min(_STRATEGY_WORKERS, strategy_count),
+            thread_name_prefix="strategy",
+        )
+        try:
+            yield lambda *strategy: executor.submit(self._fetch_strategy_pages, *strategy)
+        finally:
+            # strategies still running stop after their current request
+            gate.close()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _merge_strategy_page(
+        self,
+        description,
+        page,
+        accepted_candidates,
+        fallback_candidates,
+        desired_results,
+    ):
+        page_description = description if page.number == 1 else f"{description} (page {page.number})"
+        new_items = 0
+
+        # the Qualis strata are only resolved for articles that passed the screening
+        screened = []
+        for item, synopsis, relevance_result in zip(page.fresh_items, page.synopses, page.relevance_results):
+            if relevance_result.stage == "complete":
+                screened.append((item, synopsis, relevance_result))
+                continue
             log_event(
-                "CRAWLER_RESPONSE",
-                "Résultats reçus pour une stratégie",
-                description=description,
-                new_items=new_items,
-                total_items=total_items,
-                accepted=len(accepted_candidates),
+                "CRAWLER_REJECTED",
+                "Article rejeté : critères obligatoires manquants",
+                title=item["title"],
+                link=item["url"] or "-",
+                score=relevance_result.score,
+                missing=sorted(relevance_result.mandatory_missing),
             )
 
-            if len(accepted_candidates) >= desired_results:
-                break
-
-        selected_candidates = sorted(
-            accepted_candidates.values(),
-            key=lambda candidate: candidate[0].relevance_score,
-            reverse=True,
+        issn_strata = [find_journal_by_issn(self._extract_issns(item)) for item, _, _ in screened]
+        venue_strata = resolve_many(
+            item["venue"] or "-"
+            for (item, _, _), issn_stratum in zip(screened, issn_strata)
+            if issn_stratum is None
         )
 
-        if len(selected_candidates) < desired_results and fallback_candidates:
-            remaining = desired_results - len(selected_candidates)
-            fallback_sorted = sorted(
-                fallback_candidates.values(),
-                key=lambda candidate: candidate[0].relevance_score,
-                reverse=True,
-            )
-            selected_candidates.extend(fallback_sorted[:remaining])
-            log_event(
-                "CRAWLER_SELECTION",
-                "Ajout de candidats de secours",
-                remaining=remaining,
-            )
-
-        selected_candidates = selected_candidates[:desired_results]
+        for (item, synopsis, relevance_result), issn_stratum in zip(screened, issn_strata):
+            qualis_score = issn_stratum or venue_strata[item["venue"] or "-"]
+            new_article = self._build_article(item, synopsis, qualis_score, relevance_result)
+            title = new_article.titulo
+            link = new_article.link
 
-        self.list_authors = set(self.list_authors)
+            key = self._article_key(new_article)
 
-        for article, authors, _ in selected_candidates:
-            key = normalize_key(article)
-            if key in existing_keys:
+            if any(
+                known is not None and known[0].relevance_score >= new_article.relevance_score
+                for known in (accepted_candidates.get(key), fallback_candidates.get(key))
+            ):
                 continue
 
-            before = len(self.list_articles)
-            self.list_articles.add(article)
-            if len(self.list_articles) != before:
-                existing_keys.add(key)
-                for author in authors:
-                    if author not in self.list_authors:
-                        self.list_authors.add(author)
-                    author.addArtigo(article)
+            candidate = (new_article, item.get("paperId"), relevance_result)
+            current_count = len(accepted_candidates)
+            if self.relevance_engine.should_keep(relevance_result, current_count, desired_results):
+                replacing = key in accepted_candidates
+                if not accepted_candidates.offer(key, new_article.relevance_score, candidate):
+                    continue
+                if not replacing:
+                    new_items += 1
+                log_event(
+                    "CRAWLER_ACCEPTED",
+                    "Article retenu selon les critères",
+                    title=title,
+                    link=link,
+                    score=relevance_result.score,
+                    mandatory_hits=sorted(relevance_result.mandatory_hits),
+                    optional_hits=sorted(relevance_result.optional_hits),
+                    optional_count=len(relevance_result.optional_hits),
+                    title_only_groups=relevance_result.title_only_groups,
+                )
+            else:
+                if relevance_result.mandatory_missing:
+                    log_event(
+                        "CRAWLER_REJECTED",
+                        "Article rejeté : critères obligatoires manquants",
+                        title=title,
+                        link=link,
+                        score=relevance_result.score,
+                        missing=sorted(relevance_result.mandatory_missing),
+                    )
+                    continue
+                if not fallback_candidates.offer(key, new_article.relevance_score, candidate):
+                    continue
+                log_event(
+                    "CRAWLER_FALLBACK",
+                    "Article conservé pour analyse ultérieure",
+                    title=title,
+                    link=link,
+                    score=relevance_result.score,
+                    mandatory_hits=sorted(relevance_result.mandatory_hits),
+                    optional_hits=sorted(relevance_result.optional_hits),
+                    optional_count=len(relevance_result.optional_hits),
+                    title_only_groups=relevance_result.title_only_groups,
+                )
 
-        self.end_time = Timer.timeNow()
+        total_items = page.total
 
-        total_added = len(self.list_articles) - existing_articles
-        if responses_received == 0 or total_added <= 0:
-            self.gui.show_search_failed_alert(
-                f"Aucun nouvel article n’a été trouvé pour « {self.input_search} ». Modifiez la requête ou réessayez ultérieurement."
-            )
-            log_event(
-                "CRAWLER_EMPTY",
-                "Aucun nouvel article trouvé",
-                query=self.input_search,
-                responses=responses_received,
+        if self.gui is not None:
+            self.gui.notify_strategy_results(page_description, new_items, total_items)
+        log_event(
+            "CRAWLER_RESPONSE",
+            "Résultats reçus pour une stratégie",
+            description=description,
+            page=page.number,
+            offset=page.offset,
+            new_items=new_items,
+            total_items=total_items,
+            accepted=len(accepted_candidates),
+        )
+
+    def _build_bulk_query(self, text: str) -> str:
+        # the bulk endpoint requires every term by default, so the variants are alternatives
+        variants = list(build_text_variants(text or ""))
+        if len(variants) < 2:
+            return variants[0] if variants else ""
+        return " | ".join(f"({variant})" for variant in variants)
+
+    def _iter_bulk_pages(self, params):
+        """Yield ``(page, total, data)`` for each /paper/search/bulk page, following its token."""
+
+        page_params = dict(params)
+        page_number = 1
+        while True:
+            response = self._perform_semantic_scholar_request(
+                _BULK_SEARCH_ENDPOINT,
+                page_params,
+                request_details={
+                    "description": "Collecte massive",
+                    "params": dict(page_params),
+                    "page": page_number,
+                },
             )
-            return
+            data = response.get("data")
+            if not isinstance(data, list):
+                log_event(
+                    "CRAWLER_RESPONSE",
+                    "Réponse inattendue du service",
+                    description="Collecte massive",
+                    keys=list(response.keys()),
+                )
+                return
+            yield page_number, response.get("total", len(data)), data
 
-        self.list_articles = list(self.list_articles)
-        self.list_authors = list(self.list_authors)
+            token = response.get("token")
+            if not token or not data:
+                return
+            page_params["token"] = token
+            page_number += 1
+
+    def _screen_bulk_pages(self, pages, existing_keys):
+        """Score each page and keep the results that pass the mandatory keywords."""
+
+        for page_number, total, data in pages:
+            fresh_items = [item for item in data if self._item_key(item) not in existing_keys]
+            synopses = [self._clean_abstract(item["abstract"]) for item in fresh_items]
+            relevance_results = self.relevance_engine.evaluate_many(
+                ((item["title"], synopsis) for item, synopsis in zip(fresh_items, synopses)),
+                staged=True,
+            )
+            screened = [
+                (item, synopsis, relevance_result)
+                for item, synopsis, relevance_result in zip(fresh_items, synopses, relevance_results)
+                if relevance_result.stage == "complete"
+            ]
+            yield page_number, total, screened
+
+    def _resolve_bulk_qualis(self, batches):
+        """Attach the Qualis stratum to every screened result."""
+
+        for page_number, total, screened in batches:
+            issn_strata = [find_journal_by_issn(self._extract_issns(item)) for item, _, _ in screened]
+            venue_strata = resolve_many(
+                item["venue"] or "-"
+                for (item, _, _), issn_stratum in zip(screened, issn_strata)
+                if issn_stratum is None
+            )
+            yield page_number, total, [
+                (item, synopsis, relevance_result, issn_stratum or venue_strata[item["venue"] or "-"])
+                for (item, synopsis, relevance_result), issn_stratum in zip(screened, issn_strata)
+            ]
+
+    def _collect_bulk_candidates(self, base_query_params, existing_keys, desired_results):
+        """Harvest /paper/search/bulk results through a page-by-page generator pipeline.
+
+        Only one page of raw results is held at a time: pages are fetched,
+        screened, matched to Qualis and turned into articles lazily, and the
+        fetching stops as soon as enough articles are accepted. Accepted and
+        fallback candidates are both capped at *desired_results*, keeping the
+        best scores.
+        """
+
+        params = {
+            "query": self._build_bulk_query(self.input_search),
+            "fields": base_query_params["fields"],
+        }
+        if "year" in base_query_params:
+            params["year"] = base_query_params["year"]
+        log_event("CRAWLER_BULK", "Collecte massive via /paper/search/bulk", params=params)
 
-        self.manager.saveArtigos(self.list_articles)
-        self.manager.saveAutores(self.list_authors)
-        log_event(
-            "CRAWLER_STORAGE",
-            "Résultats sauvegardés",
-            articles_path=self.manager.arquivo_artigos,
-            authors_path=self.manager.arquivo_autores,
-            total_articles=len(self.list_articles),
-            total_authors=len(self.list_authors),
+        accepted_candidates = CandidatePool(desired_results)
+        fallback_candidates = CandidatePool(desired_results)
+        responses_received = 0
+        pipeline = self._resolve_bulk_qualis(
+            self._screen_bulk_pages(self._iter_bulk_pages(params), existing_keys)
         )
+        try:
+            for page_number, total, batch in pipeline:
+                responses_received += 1
+                previous_total = len(accepted_candidates)
+                for item, synopsis, relevance_result, qualis_score in batch:
+                    article = self._build_article(item, synopsis, qualis_score, relevance_result)
+                    candidate = (article, item.get("paperId"), relevance_result)
+                    key = self._article_key(article)
+                    if self.relevance_engine.should_keep(relevance_result, len(accepted_candidates), desired_results):
+                        accepted_candidates.offer(key, article.relevance_score, candidate)
+                        if len(accepted_candidates) >= desired_results:
+                            break
+                    elif not relevance_result.mandatory_missing:
+                        fallback_candidates.offer(key, article.relevance_score, candidate)
+
+                new_items = len(accepted_candidates) - previous_total
+                if self.gui is not None:
+                    self.gui.notify_strategy_results(f"Collecte massive (page {page_number})", new_items, total)
+                log_event(
+                    "CRAWLER_RESPONSE",
+                    "Résultats reçus pour la collecte massive",
+                    page=page_number,
+                    new_items=new_items,
+                    total_items=total,
+                    accepted=len(accepted_candidates),
+                    fallback=len(fallback_candidates),
+                )
+                if len(accepted_candidates) >= desired_results:
+                    break
+        except requests.RequestException as exc:
+            print("Failed to reach Semantic Scholar API:", exc, file=sys.stderr)
+            log_exception(
+                "CRAWLER_REQUEST_ERROR",
+                "Erreur lors de l’interrogation de Semantic Scholar",
+                exc,
+                description="Collecte massive",
+                params=params,
+            )
+            if self.gui is not None:
+                self.gui.show_search_failed_alert(self._format_request_error(exc))
+            return None
+        finally:
+            pipeline.close()
 
-        self.gui.show_search_done_alert(
-            Timer.totalTime(self.start_time, self.end_time),
-            str(total_added),
-        )
         log_event(
-            "CRAWLER_COMPLETE",
-            "Recherche terminée",
-            total_articles=len(self.list_articles),
-            added=total_added,
-            duration_seconds=Timer.totalTime(self.start_time, self.end_time).seconds,
+            "RELEVANCE_STAGES",
+            "Sorties de l’évaluation de pertinence par étape",
+            **self.relevance_engine.stage_counts,
         )
+        return accepted_candidates, fallback_candidates, responses_received
+
+    def _perform_semantic_scholar_request(self, endpoint, params, *, json_body=None, request_details=None, stop=None):
+        """Issue a request with retry logic for rate limiting and transient failures.
+
+        A *json_body* turns the request into a POST. Answers are served from
+        the response cache when possible, unless ``refresh_cache`` is set;
+        fresh answers are always stored. When the *stop* event is set while
+        the request waits for the rate limiter, nothing is sent and ``None``
+        is returned.
+        """
+        cache_params = params
+        if json_body is not None:
+            cache_params = dict(params, body=json.dumps(json_body, sort_keys=True))
+        if not self.refresh_cache:
+            cached = self._response_cache.get(endpoint, cache_params)
+            if cached is not None:
+                metadata = dict(request_details) if isinstance(request_details, dict) else {}
+                metadata.setdefault("params", dict(params))
+                log_event("CRAWLER_CACHE_HIT", "Réponse Semantic Scholar lue dans le cache", **metadata)
+                return cached
 
-    def _perform_semantic_scholar_request(self, endpoint, params, *, request_details=None):
-        """Issue a request with retry logic for rate limiting and transient failures."""
-        max_attempts = 6
-        backoff = 5
+        max_attempts = MAX_ATTEMPTS
+        backoff = INITIAL_BACKOFF
         request_logged = False
         for attempt in range(1, max_attempts + 1):
             if not request_logged:
@@ -688,23 +1370,34 @@ class Crawler:
                 attempt=attempt,
                 max_attempts=max_attempts,
             )
+            waited = self._rate_limiter.acquire(cancel=stop)
+            if stop is not None and stop.is_set():
+                return None
+            if waited:
+                log_event(
+                    "CRAWLER_HTTP_PACING",
+                    "Requête retardée par le limiteur de débit",
+                    wait_seconds=round(waited, 3),
+                )
             try:
-                with closing(
-                    self._session.get(
-                        endpoint,
-                        params=params,
-                        timeout=60,
-                    )
-                ) as response:
+                if json_body is None:
+                    response = self._session.get(endpoint, params=params, timeout=REQUEST_TIMEOUT)
+                else:
+                    response = self._session.post(endpoint, params=params, json=json_body, timeout=REQUEST_TIMEOUT)
+                with closing(response):
                     response.raise_for_status()
                     payload = response.json()
+                    self._rate_limiter.record_success(response.headers)
+                    self._response_cache.put(endpoint, cache_params, payload)
                     log_event(
                         "CRAWLER_HTTP",
                         "Réponse reçue",
                         attempt=attempt,
                         status=response.status_code,
                         remaining=response.headers.get("X-RateLimit-Remaining"),
+                        **self._rate_limiter.status(),
                     )
+                    self._notify_rate_status()
                     return payload
             except requests.HTTPError as exc:
                 response = exc.response
@@ -713,14 +1406,7 @@ class Crawler:
 
                 status_code = response.status_code
                 if status_code == 429 or status_code >= 500:
-                    retry_after = response.headers.get("Retry-After")
-                    if retry_after:
-                        try:
-                            wait_time = int(float(retry_after))
-                        except ValueError:
-                            wait_time = backoff
-                    else:
-                        wait_time = backoff
+                    wait_time = retry_after_seconds(response.headers.get("Retry-After"), backoff)
 
                     if self.gui is not None:
                         if status_code == 429:
@@ -735,11 +1421,17 @@ class Crawler:
                         attempt=attempt,
                     )
 
+                    if status_code == 429:
+                        # the pause applies to every thread, through the next acquire()
+                        self._rate_limiter.record_throttle(wait_time)
+                        self._notify_rate_status()
+
                     if attempt == max_attempts:
                         raise
 
-                    time.sleep(wait_time)
-                    backoff = min(backoff * 2, 60)
+                    if status_code != 429:
+                        time.sleep(wait_time)
+                    backoff = min(backoff * 2, MAX_BACKOFF)
                     continue
 
                 raise
@@ -757,12 +1449,17 @@ class Crawler:
                     attempt=attempt,
                 )
                 time.sleep(backoff)
-                backoff = min(backoff * 2, 60)
+                backoff = min(backoff * 2, MAX_BACKOFF)
             except requests.RequestException:
                 raise
 
         raise requests.RequestException("Exceeded retry attempts")
 
+    def _notify_rate_status(self):
+        if self.gui is not None:
+            status = self._rate_limiter.status()
+            self.gui.notify_rate_status(status["rate"], status["queue_depth"])
+
     def _format_request_error(self, exc: requests.RequestException) -> str:
         if isinstance(exc, requests.HTTPError) and exc.response is not None:
             status_code = exc.response.status_code
@@ -1,5 +1,7 @@
 import os
-import pickle
+
+from Artigo import unique_articles
+from Gerenciador import load_records
 
 
 class Merger:
@@ -18,23 +20,17 @@ class Merger:
         self.authors_list = []
 
         for i in folder_list:
-            file_name_article = os.path.join(i, 'Articles.pkl')
-            file_name_author = os.path.join(i, 'Authors.pkl')
-
-            with open(file_name_article, 'rb') as file_input:
-                articles_temp_list = pickle.load(file_input)
+            # each search numbers its own records, so each folder gets its own registry
+            articles_temp_list, authors_temp_list = load_records(i)
 
             for article in articles_temp_list:
                 self.articles_list.append(article)
 
-            with open(file_name_author, 'rb') as file_input:
-                authors_temp_list = pickle.load(file_input)
-
             for author in authors_temp_list:
                 self.authors_list.append(author)
 
-        set_articles = set(self.articles_list)
         set_authors = set(self.authors_list)
 
-        self.articles_list = list(set_articles)
+        # the same paper found by several searches is kept once
+        self.articles_list = unique_articles(self.articles_list)
         self.authors_list = list(set_authors)
\ No newline at end of file
@@ -0,0 +1,295 @@
+"""Asyncio network engine for the Semantic Scholar requests.
+
+:class:`AsyncSemanticScholarClient` keeps many requests in flight on one
+event loop with an ``httpx.AsyncClient``, which speaks SOCKS as well, so the
+Tor proxy configured for the crawler session applies unchanged. It follows
+the retry policy of ``Crawler._perform_semantic_scholar_request`` and shares
+its rate limiter and response cache. Failures are raised as ``requests``
+exceptions, so callers handle both engines the same way.
+
+The crawler itself is not async: :class:`EventLoopThread` runs the loop in
+a background thread and hands out ``concurrent.futures.Future`` objects.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Iterable, List, Mapping, Optional, Tuple
+
+import httpx
+import requests
+
+from activity_logger import log_event, log_exception
+
+MAX_ATTEMPTS = 6
+INITIAL_BACKOFF = 5
+MAX_BACKOFF = 60
+REQUEST_TIMEOUT = 60
+# concurrent connections to the API; the rate limiter still paces the requests
+_MAX_IN_FLIGHT = 8
+
+
+def retry_after_seconds(value: Optional[str], default: float) -> float:
+    """Return the delay of a ``Retry-After`` header, or *default* when it is absent or a date."""
+
+    if value:
+        try:
+            return int(float(value))
+        except ValueError:
+            pass
+    return default
+
+
+def _as_requests_response(response: httpx.Response) -> requests.Response:
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.headers.update(response.headers)
+    converted.url = str(response.url)
+    converted.reason = response.reason_phrase
+    return converted
+
+
+def _as_requests_error(exc: httpx.HTTPError) -> requests.RequestException:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return requests.HTTPError(str(exc), response=_as_requests_response(exc.response))
+    if isinstance(exc, httpx.TimeoutException):
+        return requests.Timeout(str(exc))
+    if isinstance(exc, httpx.TransportError):
+        return requests.ConnectionError(str(exc))
+    return requests.RequestException(str(exc))
+
+
+class AsyncSemanticScholarClient:
+    """Send Semantic Scholar requests from coroutines, with retries and pacing.
+
+    *limiter* and *cache* are the crawler's :class:`~rate_limiter.AdaptiveRateLimiter`
+    and :class:`~response_cache.ResponseCache`; *gui* receives the same
+    notifications as with the blocking engine.
+    """
+
+    def __init__(
+        self,
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+        proxy: Optional[str] = None,
+        limiter=None,
+        cache=None,
+        refresh: bool = False,
+        gui=None,
+        max_in_flight: int = _MAX_IN_FLIGHT,
+    ):
+        self.headers = dict(headers or {})
+        self.proxy = proxy
+        self.limiter = limiter
+        self.cache = cache
+        self.refresh = refresh
+        self.gui = gui
+        self.max_in_flight = max_in_flight
+        self._client: Optional[httpx.AsyncClient] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+
+    async def open(self) -> "AsyncSemanticScholarClient":
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                proxy=self.proxy,
+                timeout=REQUEST_TIMEOUT,
+                limits=httpx.Limits(max_connections=self.max_in_flight),
+            )
+            # created here so that it belongs to the running loop
+            self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        return self
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncSemanticScholarClient":
+        return await self.open()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _notify_rate_status(self) -> None:
+        if self.gui is not None and self.limiter is not None:
+            status = self.limiter.status()
+            self.gui.notify_rate_status(status["rate"], status["queue_depth"])
+
+    def _notify(self, status_code: Optional[int], wait_time: float, attempt: int) -> None:
+        if self.gui is None:
+            return
+        if status_code == 429:
+            self.gui.notify_rate_limit(wait_time, attempt, MAX_ATTEMPTS)
+        else:
+            self.gui.notify_transient_error(wait_time, attempt, MAX_ATTEMPTS)
+
+    async def request(
+        self,
+        endpoint: str,
+        params: Mapping[str, Any],
+        *,
+        json_body: Any = None,
+        request_details: Optional[dict] = None,
+    ) -> Any:
+        """Return the decoded answer of a GET, or of a POST when *json_body* is given."""
+
+        await self.open()
+        cache_params = params
+        if json_body is not None:
+            cache_params = dict(params, body=json.dumps(json_body, sort_keys=True))
+        metadata = dict(request_details) if isinstance(request_details, dict) else {}
+        metadata.setdefault("params", dict(params))
+        if self.cache is not None and not self.refresh:
+            cached = self.cache.get(endpoint, cache_params)
+            if cached is not None:
+                log_event("CRAWLER_CACHE_HIT", "Réponse Semantic Scholar lue dans le cache", **metadata)
+                return cached
+
+        log_event("CRAWLER_REQUEST", "Envoi d’une requête Semantic Scholar", engine="asyncio", **metadata)
+        backoff = INITIAL_BACKOFF
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            if self.limiter is not None:
+                waited = await self.limiter.acquire_async()
+                if waited:
+                    log_event(
+                        "CRAWLER_HTTP_PACING",
+                        "Requête retardée par le limiteur de débit",
+                        wait_seconds=round(waited, 3),
+                    )
+            try:
+                async with self._in_flight:
+                    if json_body is None:
+                        response = await self._client.get(endpoint, params=params)
+                    else:
+                        response = await self._client.post(endpoint, params=params, json=json_body)
+                    response.raise_for_status()
+                    payload = response.json()
+            except httpx.HTTPStatusError as exc:
+                status_code = exc.response.status_code
+                if status_code != 429 and status_code < 500:
+                    raise _as_requests_error(exc) from exc
+
+                wait_time = retry_after_seconds(exc.response.headers.get("Retry-After"), backoff)
+                self._notify(status_code, wait_time, attempt)
+                log_event(
+                    "CRAWLER_HTTP_WAIT",
+                    "Réponse HTTP invite à patienter",
+                    status=status_code,
+                    wait_seconds=wait_time,
+                    attempt=attempt,
+                )
+                if status_code == 429 and self.limiter is not None:
+                    # the pause applies to every request, through the next acquire
+                    self.limiter.record_throttle(wait_time)
+                    self._notify_rate_status()
+                if attempt == MAX_ATTEMPTS:
+                    raise _as_requests_error(exc) from exc
+                if status_code != 429 or self.limiter is None:
+                    await asyncio.sleep(wait_time)
+                backoff = min(backoff * 2, MAX_BACKOFF)
+                continue
+            except (httpx.TimeoutException, httpx.TransportError) as exc:
+                if attempt == MAX_ATTEMPTS:
+                    raise _as_requests_error(exc) from exc
+                self._notify(None, backoff, attempt)
+                log_exception(
+                    "CRAWLER_HTTP_WAIT",
+                    "Nouvelle tentative après erreur réseau",
+                    exc,
+                    wait_seconds=backoff,
+                    attempt=attempt,
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF)
+                continue
+            except httpx.HTTPError as exc:
+                raise _as_requests_error(exc) from exc
+
+            if self.limiter is not None:
+                self.limiter.record_success(response.headers)
+            if self.cache is not None:
+                self.cache.put(endpoint, cache_params, payload)
+            log_event(
+                "CRAWLER_HTTP",
+                "Réponse reçue",
+                attempt=attempt,
+                status=response.status_code,
+                remaining=response.headers.get("X-RateLimit-Remaining"),
+                engine="asyncio",
+            )
+            self._notify_rate_status()
+            return payload
+
+        raise requests.RequestException("Exceeded retry attempts")
+
+    async def request_many(self, calls: Iterable[Tuple[str, Mapping[str, Any]]]) -> List[Any]:
+        """Run ``(endpoint, params)`` requests concurrently; the first failure cancels the others."""
+
+        return await gather_or_cancel(self.request(endpoint, params) for endpoint, params in calls)
+
+
+async def gather_or_cancel(awaitables: Iterable[Awaitable[Any]]) -> List[Any]:
+    """Like ``asyncio.gather``, but cancels and awaits the siblings when one of them fails."""
+
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class EventLoopThread:
+    """An event loop running in a daemon thread, for synchronous callers.
+
+    Leaving the ``with`` block cancels the coroutines still running and
+    waits for them before the loop is closed.
+    """
+
+    def __init__(self, name: str = "s2-asyncio"):
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "EventLoopThread":
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name=self.name, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            self.run(self.cancel_pending())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self.loop.close()
+
+    def submit(self, coroutine: Awaitable[Any]) -> Future:
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine: Awaitable[Any]) -> Any:
+        return self.submit(coroutine).result()
+
+    async def cancel_pending(self) -> None:
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+__all__ = [
+    "AsyncSemanticScholarClient",
+    "EventLoopThread",
+    "gather_or_cancel",
+    "retry_after_seconds",
+    "MAX_ATTEMPTS",
+    "INITIAL_BACKOFF",
+    "MAX_BACKOFF",
+    "REQUEST_TIMEOUT",
+]
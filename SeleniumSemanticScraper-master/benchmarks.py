@@ -0,0 +1,745 @@
+"""Offline micro-benchmarks for the hot paths of the crawler.
+
+Run from the project folder, for example::
+
+    python benchmarks.py qualis
+
+Each benchmark only uses local data so it can be repeated without network
+access and compared between two revisions.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+from typing import Callable, List, Sequence
+
+from rapidfuzz import fuzz
+
+
+def _measure(label: str, function: Callable[[object], object], inputs: Sequence[object]) -> float:
+    start = time.perf_counter()
+    for value in inputs:
+        function(value)
+    elapsed = time.perf_counter() - start
+    rate = len(inputs) / elapsed if elapsed else float('inf')
+    print(f"{label:<32} {len(inputs):>6} appels  {elapsed:8.3f} s  {rate:10.1f} appels/s")
+    return rate
+
+
+def _measure_batch(label: str, function: Callable[[List[str]], list], inputs: List[str]) -> list:
+    start = time.perf_counter()
+    results = function(inputs)
+    elapsed = time.perf_counter() - start
+    rate = len(inputs) / elapsed if elapsed else float('inf')
+    print(f"{label:<32} {len(inputs):>6} appels  {elapsed:8.3f} s  {rate:10.1f} appels/s")
+    return results
+
+
+def _sample_venues(titles: Sequence[str], size: int, seed: int = 1234) -> List[str]:
+    """Build venue names resembling Semantic Scholar ``venue`` values."""
+
+    rng = random.Random(seed)
+    venues: List[str] = []
+    for _ in range(size):
+        title = rng.choice(titles)
+        words = title.split()
+        roll = rng.random()
+        if roll < 0.3:
+            venues.append(title.title())
+        elif roll < 0.5 and len(words) > 2:
+            words.pop(rng.randrange(len(words)))
+            venues.append(" ".join(words).lower())
+        elif roll < 0.7:
+            letters = list(title)
+            for _ in range(rng.randint(1, 3)):
+                letters[rng.randrange(len(letters))] = rng.choice("AEIOU ")
+            venues.append("".join(letters).title())
+        else:
+            venues.append(f"Proceedings of the {rng.randint(1, 40)}th Workshop on {words[0].lower()} systems")
+    return venues
+
+
+def _legacy_qualis_lookup(qualis_df, target_text: str, threshold: int = 70) -> str:
+    """Row-by-row scan of the Qualis table, as implemented before QualisIndex."""
+
+    similar_rows = []
+    for _, row in qualis_df.iterrows():
+        value = re.sub(r'\s*\((PRINT|ONLINE|IMPRESSO)\)\s*', '', row['TíTULO'])
+        similarity_score = round(fuzz.ratio(target_text.upper(), value))
+        if similarity_score >= threshold:
+            similar_rows.append((row['ESTRATO'], similarity_score))
+    similar_rows.sort(key=lambda x: x[1], reverse=True)
+    if similar_rows:
+        return similar_rows[0][0]
+    return 'NF'
+
+
+def bench_qualis(args: argparse.Namespace) -> None:
+    import pandas as pd
+
+    import findQualis
+
+    qualis_df = pd.read_csv(findQualis._CSV_PATH, encoding="ISO-8859-1")
+    index = findQualis.get_qualis_index()
+    venues = _sample_venues(index.titles, args.size)
+    print(f"Table Qualis : {len(qualis_df)} lignes, {len(index)} titres distincts")
+
+    legacy_sample = venues[:args.legacy_size]
+    mismatches = [
+        venue
+        for venue in legacy_sample
+        if _legacy_qualis_lookup(qualis_df, venue) != index.lookup(venue)
+    ]
+    print(f"Concordance avec le parcours ligne à ligne : {len(legacy_sample) - len(mismatches)}/{len(legacy_sample)}")
+
+    legacy_rate = _measure(
+        "iterrows + fuzz.ratio",
+        lambda venue: _legacy_qualis_lookup(qualis_df, venue),
+        legacy_sample,
+    )
+    index_rate = _measure("QualisIndex.lookup", index.lookup, venues)
+    print(f"Accélération : x{index_rate / legacy_rate:.1f}")
+
+    exhaustive = _measure_batch(
+        "lookup_many (table complète)",
+        lambda values: index.lookup_many(values, workers=-1, exhaustive=True),
+        venues,
+    )
+    blocked = _measure_batch(
+        "lookup_many (trigrammes)",
+        lambda values: index.lookup_many(values, workers=-1, exhaustive=False),
+        venues,
+    )
+    identical = sum(1 for expected, stratum in zip(exhaustive, blocked) if expected == stratum)
+    print(f"Rappel du filtrage par trigrammes : {identical}/{len(venues)}")
+    candidate_sizes = sorted(len(index.candidates(venue.upper())) for venue in venues)
+    print(
+        f"Candidats par revue : médiane {candidate_sizes[len(candidate_sizes) // 2]}, "
+        f"max {candidate_sizes[-1]} sur {len(index)} titres"
+    )
+
+
+_FILLER_WORDS = (
+    "the study results analysis method field data model performance approach sample "
+    "training accuracy protocol evaluation system trial area survey response signal "
+    "environment operational conditions rate false positive negative handlers team"
+).split()
+
+
+def _synthetic_abstracts(size: int, terms: Sequence[str], density: float = 0.04, length: int = 180, seed: int = 42):
+    """Return ``(title, abstract)`` pairs mixing filler words with query *terms*."""
+
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        words = [
+            rng.choice(terms) if rng.random() < density else rng.choice(_FILLER_WORDS)
+            for _ in range(length)
+        ]
+        title_words = [rng.choice(terms) if rng.random() < 0.3 else rng.choice(_FILLER_WORDS) for _ in range(10)]
+        corpus.append((" ".join(title_words).capitalize(), ". ".join(" ".join(words[i:i + 15]) for i in range(0, length, 15))))
+    return corpus
+
+
+_RELEVANCE_QUERY = "explosive detection dog landmine odor"
+_RELEVANCE_KEYWORDS = (
+    [{'label': 'chien', 'forms': ['chien', 'dog'], 'display_terms': {'chien', 'dog'}}],
+    [{'label': 'robot', 'forms': ['robot'], 'display_terms': {'robot'}}],
+)
+
+
+def _legacy_normalize(text: str) -> str:
+    """Text normalization of the relevance engine before ``text_normalizer``."""
+
+    cleaned = re.sub(r"[^\w\s-]", " ", text.lower())
+    cleaned = re.sub(r"[_-]+", " ", cleaned)
+    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+    return cleaned
+
+
+def _legacy_evaluate(engine, title: str, abstract: str):
+    """``QueryRelevanceEngine.evaluate`` as written before the compiled matcher."""
+
+    from RelevanceEngine import RelevanceResult
+
+    normalized_title = _legacy_normalize(title or "")
+    normalized_abstract = _legacy_normalize(abstract or "")
+    combined_text = f"{normalized_title} {normalized_abstract}".strip()
+    text_for_keywords = normalized_abstract or combined_text
+
+    matched_groups = title_only_groups = core_matches = 0
+    matched_weight = 0.0
+    matched_concepts, mandatory_hits, mandatory_missing, optional_hits = set(), set(), set(), set()
+
+    for label, terms in engine.mandatory_keywords:
+        if text_for_keywords and any(term in text_for_keywords for term in terms):
+            mandatory_hits.add(label)
+        else:
+            mandatory_missing.add(label)
+    for label, terms in engine.optional_keywords:
+        if text_for_keywords and any(term in text_for_keywords for term in terms):
+            optional_hits.add(label)
+    for group in engine.concept_groups:
+        abstract_hit = normalized_abstract and any(term in normalized_abstract for term in group.terms)
+        title_hit = normalized_title and any(term in normalized_title for term in group.terms)
+        if abstract_hit:
+            matched_groups += 1
+            matched_concepts.add(group.name)
+            matched_weight += group.weight
+            if group.weight >= 1.0:
+                core_matches += 1
+        elif title_hit:
+            title_only_groups += 1
+            matched_concepts.add(group.name)
+            matched_weight += group.weight * 0.4
+
+    keyword_basis = text_for_keywords or combined_text
+    matched_terms = {term for term in engine.keyword_terms if term and term in keyword_basis} if keyword_basis else set()
+    keyword_coverage = (len(matched_terms) / len(engine.keyword_terms) * 100) if engine.keyword_terms and keyword_basis else 0
+    ratio_title = fuzz.partial_ratio(engine.normalized_query, normalized_title) if normalized_title else 0
+    ratio_abstract = fuzz.partial_ratio(engine.normalized_query, normalized_abstract) if normalized_abstract else 0
+    coverage_ratio = 0
+    if engine.total_concept_weight:
+        coverage_ratio = matched_weight / engine.total_concept_weight * 100
+    elif engine.keyword_groups:
+        coverage_ratio = (matched_groups / len(engine.keyword_groups)) * 100
+    score = 0.20 * ratio_title + 0.40 * ratio_abstract + 0.25 * coverage_ratio + 0.15 * keyword_coverage
+    score += 10 * len(mandatory_hits) + 6 * len(optional_hits) + 2 * title_only_groups
+    return RelevanceResult(
+        score=round(score, 2),
+        matched_groups=matched_groups,
+        title_only_groups=title_only_groups,
+        matched_terms=matched_terms,
+        matched_concepts=matched_concepts,
+        core_matches=core_matches,
+        mandatory_missing=mandatory_missing,
+        mandatory_hits=mandatory_hits,
+        optional_hits=optional_hits,
+    )
+
+
+def bench_relevance(args: argparse.Namespace) -> None:
+    from RelevanceEngine import QueryRelevanceEngine
+
+    mandatory, optional = _RELEVANCE_KEYWORDS
+    engine = QueryRelevanceEngine(_RELEVANCE_QUERY, mandatory_keywords=mandatory, optional_keywords=optional)
+    terms = sorted(engine.keyword_terms)
+    corpus = _synthetic_abstracts(args.size, terms)
+    print(f"{len(engine.concept_groups)} groupes, {len(terms)} termes, {len(corpus)} résumés")
+
+    identical = sum(1 for title, abstract in corpus if _legacy_evaluate(engine, title, abstract) == engine.evaluate(title, abstract))
+    print(f"Résultats identiques à l’ancienne évaluation : {identical}/{len(corpus)}")
+
+    legacy_rate = _measure("évaluation par sous-chaînes", lambda pair: _legacy_evaluate(engine, *pair), corpus)
+    compiled_rate = _measure("évaluation compilée", lambda pair: engine.evaluate(*pair), corpus)
+    print(f"Accélération : x{compiled_rate / legacy_rate:.1f}")
+
+    batch = _measure_batch("evaluate_many", engine.evaluate_many, corpus)
+    identical = sum(1 for (title, abstract), result in zip(corpus, batch) if engine.evaluate(title, abstract) == result)
+    print(f"Résultats identiques entre evaluate_many et evaluate : {identical}/{len(corpus)}")
+
+    engine.stage_counts.clear()
+    staged = _measure_batch("evaluate_many (par étapes)", lambda pairs: engine.evaluate_many(pairs, staged=True), corpus)
+    decisions = sum(
+        1
+        for position, (full, screened) in enumerate(zip(batch, staged))
+        if engine.should_keep(full, position, args.size) == engine.should_keep(screened, position, args.size)
+    )
+    print(f"Décisions identiques avec l’évaluation par étapes : {decisions}/{len(corpus)}")
+    print("Sorties par étape : " + ", ".join(f"{stage} {count}" for stage, count in sorted(engine.stage_counts.items())))
+
+    normalized = [engine.normalize_text(abstract) for _, abstract in corpus]
+    legacy_rate = _measure(
+        "termes : sous-chaînes",
+        lambda text: {term for term in engine.keyword_terms if term in text},
+        normalized,
+    )
+    compiled_rate = _measure("termes : automate compilé", engine._matched_terms, normalized)
+    print(f"Accélération de la recherche des termes : x{compiled_rate / legacy_rate:.1f}")
+
+
+def bench_rank(args: argparse.Namespace) -> None:
+    from types import SimpleNamespace
+
+    from RelevanceEngine import ArticleIndex, QueryRelevanceEngine
+
+    mandatory, optional = _RELEVANCE_KEYWORDS
+    engine = QueryRelevanceEngine(_RELEVANCE_QUERY, mandatory_keywords=mandatory, optional_keywords=optional)
+    corpus = _synthetic_abstracts(args.size, sorted(engine.keyword_terms), density=0.02)
+    articles = [SimpleNamespace(titulo=title, synopsis=abstract) for title, abstract in corpus]
+
+    start = time.perf_counter()
+    index = ArticleIndex(articles)
+    index.scores({})
+    print(f"Indexation de {len(index)} articles : {time.perf_counter() - start:.3f} s, {len(index.vocabulary)} termes")
+
+    for mode in ("bm25", "tfidf"):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            ranked = engine.rank(index, mode=mode, limit=args.limit)
+        elapsed = (time.perf_counter() - start) / args.repeat
+        full = engine.rank(index, mode=mode)
+        same = [article for article, _ in ranked] == [article for article, _ in full[:args.limit]]
+        print(f"{mode:<6} classement des {args.limit} premiers : {elapsed * 1000:7.2f} ms  (identique au tri complet : {same})")
+
+    ratio_start = time.perf_counter()
+    engine.evaluate_many((article.titulo, article.synopsis) for article in articles)
+    print(f"evaluate_many sur le même corpus : {(time.perf_counter() - ratio_start) * 1000:.0f} ms")
+
+
+def bench_rescore(args: argparse.Namespace) -> None:
+    import tempfile
+    from types import SimpleNamespace
+
+    from RelevanceEngine import QueryRelevanceEngine
+    from Rescorer import Rescorer
+
+    mandatory, optional = _RELEVANCE_KEYWORDS
+    with tempfile.TemporaryDirectory() as root:
+        rescorer = Rescorer(_RELEVANCE_QUERY, root)
+        rescorer.relevance_engine = QueryRelevanceEngine(
+            _RELEVANCE_QUERY, mandatory_keywords=mandatory, optional_keywords=optional
+        )
+        corpus = _synthetic_abstracts(args.size, sorted(rescorer.relevance_engine.keyword_terms))
+        articles = [SimpleNamespace(titulo=title, synopsis=abstract) for title, abstract in corpus]
+
+        start = time.perf_counter()
+        single = rescorer.evaluate(articles, workers=1)
+        print(f"1 processus               {len(articles)} articles  {time.perf_counter() - start:7.3f} s")
+        start = time.perf_counter()
+        parallel = rescorer.evaluate(articles, workers=args.workers)
+        print(f"{args.workers} processus               {len(articles)} articles  {time.perf_counter() - start:7.3f} s")
+
+    identical = sum(1 for expected, result in zip(single, parallel) if expected == result)
+    print(f"Résultats identiques entre les deux chemins : {identical}/{len(articles)}")
+    if identical != len(articles) or len(parallel) != len(articles):
+        raise SystemExit("La réévaluation multiprocessus diffère du calcul en un seul processus")
+
+
+def bench_synonyms(args: argparse.Namespace) -> None:
+    import json
+    import tempfile
+    from pathlib import Path
+
+    from RelevanceEngine import load_synonym_tables
+
+    rng = random.Random(7)
+    vocabulary = [f"term{position}" for position in range(args.bank_size * 4)]
+    synonyms = {token: rng.sample(vocabulary, 8) for token in vocabulary[:args.bank_size]}
+    phrases = {
+        f"{rng.choice(vocabulary)} {rng.choice(vocabulary)}": [" ".join(rng.sample(vocabulary, 2)) for _ in range(6)]
+        for _ in range(args.bank_size // 4)
+    }
+    queries = [" ".join(rng.sample(vocabulary, 6)) for _ in range(args.queries)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        data_path = Path(directory) / "synonyms.json"
+        compiled_path = Path(directory) / "synonyms.pkl"
+        data_path.write_text(json.dumps({"synonyms": synonyms, "phrases": phrases}), encoding="utf-8")
+
+        start = time.perf_counter()
+        load_synonym_tables(data_path, compiled_path)
+        print(f"Compilation de {len(synonyms)} synonymes et {len(phrases)} expressions : {time.perf_counter() - start:.3f} s")
+        start = time.perf_counter()
+        tables = load_synonym_tables(data_path, compiled_path)
+        print(f"Chargement du fichier compilé : {time.perf_counter() - start:.3f} s")
+
+    _measure("expansion d’une requête", lambda query: (tables.find_phrases(query.split()), [tables.expand_token(token) for token in query.split()]), queries)
+
+
+def _load_texts(path: str | None, size: int) -> List[str]:
+    """Titles and synopses stored in an ``Articles.pkl``, or a synthetic corpus without one."""
+
+    if path:
+        import pickle
+
+        with open(path, 'rb') as file_input:
+            articles = pickle.load(file_input)
+        texts = [text for article in articles for text in (article.titulo or "", article.synopsis or "")]
+        print(f"{len(articles)} articles lus dans {path}")
+        return texts
+    terms = "Détection d'explosifs, K-9 teams & UXO (landmine) search_dogs".split()
+    print("Aucun fichier Articles.pkl indiqué : corpus synthétique")
+    return [text for pair in _synthetic_abstracts(size, terms) for text in pair]
+
+
+def bench_normalize(args: argparse.Namespace) -> None:
+    from text_normalizer import clear_normalization_cache, normalize_text
+
+    texts = _load_texts(args.articles, args.size)
+    identical = sum(1 for text in texts if _legacy_normalize(text) == normalize_text(text))
+    print(f"Textes normalisés à l’identique : {identical}/{len(texts)}")
+
+    legacy_rate = _measure("trois substitutions re.sub", _legacy_normalize, texts)
+    clear_normalization_cache()
+    translate_rate = _measure("table de traduction", normalize_text, texts)
+    cached_rate = _measure("table de traduction (en cache)", normalize_text, texts)
+    print(f"Accélération : x{translate_rate / legacy_rate:.1f}, x{cached_rate / legacy_rate:.0f} pour un article déjà vu")
+
+
+_QUERY_LEVELS = (
+    ("1 mot", "landmine", (), ()),
+    ("3 mots", "explosive detection dog", (), ()),
+    ("5 mots + 2 mots-clés", "mine detection dog handler odor", ("chien",), ("robot",)),
+    (
+        "8 mots + 6 mots-clés",
+        "explosive detection dog search dog landmine odor review robot",
+        ("chien", "explosif", "odeur"),
+        ("robot", "drone", "capteur"),
+    ),
+)
+
+
+def _keyword_rules(terms: Sequence[str]) -> List[dict]:
+    return [{'label': term, 'forms': [term], 'display_terms': {term}} for term in terms]
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def bench_engine(args: argparse.Namespace) -> None:
+    import tracemalloc
+
+    from RelevanceEngine import QueryRelevanceEngine
+    from text_normalizer import clear_normalization_cache
+
+    print(
+        f"{'requête':<26} {'résumé':>6} {'densité':>7} {'éval/s':>9} {'p50 µs':>8} {'p99 µs':>8} "
+        f"{'pic Kio':>8} {'keep µs':>8}"
+    )
+    for label, query, mandatory, optional in _QUERY_LEVELS:
+        start = time.perf_counter()
+        engine = QueryRelevanceEngine(
+            query,
+            mandatory_keywords=_keyword_rules(mandatory),
+            optional_keywords=_keyword_rules(optional),
+        )
+        construction = time.perf_counter() - start
+        start = time.perf_counter()
+        targeted = engine.build_targeted_queries()
+        targeting = time.perf_counter() - start
+        terms = sorted(engine.keyword_terms)
+
+        for length in args.lengths:
+            for density in args.densities:
+                corpus = _synthetic_abstracts(args.size, terms, density=density, length=length, seed=length)
+                clear_normalization_cache()
+                latencies = []
+                results = []
+                for title, abstract in corpus:
+                    begin = time.perf_counter_ns()
+                    results.append(engine.evaluate(title, abstract))
+                    latencies.append(time.perf_counter_ns() - begin)
+                latencies.sort()
+                throughput = len(latencies) / (sum(latencies) / 1e9)
+
+                begin = time.perf_counter_ns()
+                for position, result in enumerate(results):
+                    engine.should_keep(result, position, args.size)
+                keep_latency = (time.perf_counter_ns() - begin) / len(results) / 1000
+
+                # peak memory of a single evaluation, on texts not yet normalized
+                clear_normalization_cache()
+                peaks = []
+                tracemalloc.start()
+                for title, abstract in corpus[:args.traced]:
+                    tracemalloc.reset_peak()
+                    baseline = tracemalloc.get_traced_memory()[0]
+                    engine.evaluate(title, abstract)
+                    peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+                tracemalloc.stop()
+                peaks.sort()
+
+                print(
+                    f"{label:<26} {length:>6} {density:>7.2f} {throughput:>9.0f} "
+                    f"{_percentile(latencies, 0.5) / 1000:>8.1f} {_percentile(latencies, 0.99) / 1000:>8.1f} "
+                    f"{_percentile(peaks, 0.5) / 1024:>8.1f} {keep_latency:>8.2f}"
+                )
+        print(
+            f"{'':<26} construction {construction * 1000:.2f} ms, "
+            f"build_targeted_queries {targeting * 1000:.2f} ms ({len(targeted)} requêtes, "
+            f"{len(engine.concept_groups)} groupes, {len(terms)} termes)"
+        )
+
+
+def _start_stub_server(latency: float, page_size: int):
+    """Serve fake /paper/search pages on localhost, each answer delayed by *latency* seconds."""
+
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    body = json.dumps({
+        "total": 1000,
+        "data": [
+            {"paperId": f"{index:040x}", "title": f"Paper {index}", "abstract": "detection dog " * 40}
+            for index in range(page_size)
+        ],
+    }).encode('utf-8')
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def bench_network(args: argparse.Namespace) -> None:
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    import requests
+
+    from async_client import AsyncSemanticScholarClient
+
+    server = _start_stub_server(args.latency, args.page_size)
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}/graph/v1/paper/search"
+    calls = [{"query": "detection dog", "offset": offset, "limit": args.page_size} for offset in range(args.requests)]
+    print(f"{args.requests} requêtes, latence simulée {args.latency * 1000:.0f} ms, sans limiteur ni cache")
+
+    session = requests.Session()
+
+    def fetch(params):
+        with session.get(endpoint, params=params, timeout=60) as response:
+            return response.json()
+
+    def sequential(batch):
+        return [fetch(params) for params in batch]
+
+    def thread_pool(batch):
+        with ThreadPoolExecutor(max_workers=args.in_flight) as executor:
+            return list(executor.map(fetch, batch))
+
+    async def _asyncio(batch):
+        async with AsyncSemanticScholarClient(max_in_flight=args.in_flight) as client:
+            return await client.request_many((endpoint, params) for params in batch)
+
+    def timed(label, engine):
+        start = time.perf_counter()
+        engine(calls)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<32} {len(calls):>6} requêtes  {elapsed:8.3f} s  {len(calls) / elapsed:10.1f} requêtes/s")
+        return elapsed
+
+    sequential_time = timed("requests.Session séquentiel", sequential)
+    threads_time = timed(f"requests, {args.in_flight} threads", thread_pool)
+    async_time = timed(f"asyncio, {args.in_flight} en vol", lambda batch: asyncio.run(_asyncio(batch)))
+    print(f"Accélération : x{sequential_time / threads_time:.1f} (threads), x{sequential_time / async_time:.1f} (asyncio)")
+    server.shutdown()
+
+
+class _LegacyArtigo:
+    """An article as it was stored before the records had ids: a ``__dict__`` with ``Autor`` objects."""
+
+    def __init__(self, titulo, link, bibtex, synopsis, identity):
+        self.titulo = titulo
+        self.autores = []
+        self.publicado_em = "Journal of Detection"
+        self.data = "2020"
+        self.citacoes = "12"
+        self.data_relativa = 0
+        self.citacoes_relativa = 0
+        self.cite_label = 0
+        self.total_factor = 0
+        self.impact_factor = " "
+        self.link = link
+        self.cite = "article"
+        self.bibtex = bibtex
+        self.synopsis = synopsis
+        self.qualis = "A1"
+        self.relevance_score = 0.0
+        self.concepts = []
+        self.paper_id = None
+        self.external_ids = {}
+        self.identity = identity
+
+    def __lt__(self, other):
+        return self.titulo < other.titulo
+
+
+class _LegacyAutor:
+    def __init__(self, nome):
+        self.nome = nome
+        self.artigos = []
+        self.link = None
+
+    def addArtigo(self, artigo):
+        self.artigos.append(artigo)
+        self.artigos.sort()
+
+    def __lt__(self, other):
+        return self.nome < other.nome
+
+
+def bench_storage(args: argparse.Namespace) -> None:
+    import gc
+    import os
+    import pickle
+    import sys
+    import tempfile
+    import threading
+    import tracemalloc
+
+    from Artigo import Artigo, article_identity
+    from Autor import Autor
+    from Gerenciador import load_records
+    from record_registry import RecordRegistry
+
+    rng = random.Random(7)
+    papers = [
+        (
+            f"Detection dog study {rng.random():.12f}",
+            f"https://www.semanticscholar.org/paper/{index:040x}",
+            "@article{key, title={Detection dog study}, author={Someone}, year={2020}}",
+            "canine olfaction explosive detection field trial " * 20,
+            rng.sample(range(args.authors), args.per_article),
+        )
+        for index in range(args.articles)
+    ]
+    print(f"{args.articles} articles, {args.authors} auteurs, {args.per_article} auteurs par article")
+
+    def build_legacy():
+        authors = [_LegacyAutor(f"Author {index}") for index in range(args.authors)]
+        articles = []
+        for titulo, link, bibtex, synopsis, author_indexes in papers:
+            artigo = _LegacyArtigo(titulo, link, bibtex, synopsis, article_identity(None, None, titulo, link))
+            artigo.autores = [authors[index] for index in author_indexes]
+            for autor in artigo.autores:
+                autor.addArtigo(artigo)
+            articles.append(artigo)
+        return articles, authors
+
+    def build_records():
+        registry = RecordRegistry()
+        authors = [registry.add_author(Autor(f"Author {index}", None)) for index in range(args.authors)]
+        articles = []
+        for titulo, link, bibtex, synopsis, author_indexes in papers:
+            artigo = registry.add_article(Artigo(titulo, [], "Journal of Detection", "2020", "12", link, "article", bibtex, synopsis, "A1"))
+            artigo.autores = [authors[index] for index in author_indexes]
+            for autor in artigo.autores:
+                autor.addArtigo(artigo)
+            articles.append(artigo)
+        return articles, authors
+
+    def load_legacy(directory):
+        loaded = []
+        for name in ('Articles.pkl', 'Authors.pkl'):
+            with open(os.path.join(directory, name), 'rb') as file_input:
+                loaded.append(pickle.load(file_input))
+        return loaded
+
+    def measure(label, build, load):
+        directory = tempfile.mkdtemp()
+        start = time.perf_counter()
+        articles, authors = build()
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        for name, records in (('Articles.pkl', articles), ('Authors.pkl', authors)):
+            with open(os.path.join(directory, name), 'wb') as file_output:
+                pickle.dump(records, file_output, -1)
+        saved = time.perf_counter() - start
+        sizes = [os.path.getsize(os.path.join(directory, name)) / 1024 / 1024 for name in ('Articles.pkl', 'Authors.pkl')]
+        del articles, authors
+        gc.collect()
+
+        start = time.perf_counter()
+        loaded = load(directory)
+        elapsed = time.perf_counter() - start
+        del loaded
+        gc.collect()
+        tracemalloc.start()
+        loaded = load(directory)
+        memory = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+        tracemalloc.stop()
+        del loaded
+        print(
+            f"{label:<28} liaison {built:6.2f} s  écriture {saved:6.2f} s  "
+            f"Articles.pkl {sizes[0]:7.1f} Mo  Authors.pkl {sizes[1]:7.1f} Mo  "
+            f"lecture {elapsed:6.2f} s  mémoire {memory:7.1f} Mo"
+        )
+
+    # the cyclic graph is pickled recursively, beyond the default recursion limit and thread stack
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 1_000_000))
+    threading.stack_size(512 * 1024 * 1024)
+    legacy = threading.Thread(target=measure, args=("graphe d’objets (précédent)", build_legacy, load_legacy))
+    legacy.start()
+    legacy.join()
+    measure("enregistrements à ids", build_records, load_records)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    qualis_parser = subparsers.add_parser('qualis', help="recherche des strates Qualis")
+    qualis_parser.add_argument('--size', type=int, default=500)
+    qualis_parser.add_argument('--legacy-size', type=int, default=10)
+    qualis_parser.set_defaults(handler=bench_qualis)
+
+    relevance_parser = subparsers.add_parser('relevance', help="évaluation de la pertinence des résumés")
+    relevance_parser.add_argument('--size', type=int, default=2000)
+    relevance_parser.set_defaults(handler=bench_relevance)
+
+    rank_parser = subparsers.add_parser('rank', help="classement BM25 / TF-IDF des articles enregistrés")
+    rank_parser.add_argument('--size', type=int, default=20000)
+    rank_parser.add_argument('--limit', type=int, default=50)
+    rank_parser.add_argument('--repeat', type=int, default=20)
+    rank_parser.set_defaults(handler=bench_rank)
+
+    rescore_parser = subparsers.add_parser('rescore', help="réévaluation d’une recherche sur plusieurs processus")
+    rescore_parser.add_argument('--size', type=int, default=2000)
+    rescore_parser.add_argument('--workers', type=int, default=4)
+    rescore_parser.set_defaults(handler=bench_rescore)
+
+    synonyms_parser = subparsers.add_parser('synonyms', help="compilation des tables de synonymes")
+    synonyms_parser.add_argument('--bank-size', type=int, default=5000)
+    synonyms_parser.add_argument('--queries', type=int, default=2000)
+    synonyms_parser.set_defaults(handler=bench_synonyms)
+
+    normalize_parser = subparsers.add_parser('normalize', help="normalisation des titres et résumés")
+    normalize_parser.add_argument('--articles', help="fichier Articles.pkl d’une recherche enregistrée")
+    normalize_parser.add_argument('--size', type=int, default=2000)
+    normalize_parser.set_defaults(handler=bench_normalize)
+
+    engine_parser = subparsers.add_parser('engine', help="latence de l’évaluation selon la complexité de la requête")
+    engine_parser.add_argument('--size', type=int, default=1000)
+    engine_parser.add_argument('--lengths', type=int, nargs='+', default=[60, 180, 600])
+    engine_parser.add_argument('--densities', type=float, nargs='+', default=[0.01, 0.05])
+    engine_parser.add_argument('--traced', type=int, default=100, help="évaluations suivies par tracemalloc")
+    engine_parser.set_defaults(handler=bench_engine)
+
+    network_parser = subparsers.add_parser('network', help="moteurs réseau contre un serveur local simulé")
+    network_parser.add_argument('--requests', type=int, default=200)
+    network_parser.add_argument('--latency', type=float, default=0.05, help="latence du serveur en secondes")
+    network_parser.add_argument('--page-size', type=int, default=100)
+    network_parser.add_argument('--in-flight', type=int, default=8)
+    network_parser.set_defaults(handler=bench_network)
+
+    storage_parser = subparsers.add_parser('storage', help="taille et lecture de Articles.pkl / Authors.pkl")
+    storage_parser.add_argument('--articles', type=int, default=50000)
+    storage_parser.add_argument('--authors', type=int, default=15000)
+    storage_parser.add_argument('--per-article', type=int, default=3)
+    storage_parser.set_defaults(handler=bench_storage)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
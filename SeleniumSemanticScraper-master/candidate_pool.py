@@ -0,0 +1,90 @@
+"""Bounded selection of the best crawl candidates.
+
+The crawler only keeps ``desired_results`` articles in the end, so holding
+every accepted or fallback candidate of a deep or bulk crawl until the final
+sort wastes memory. :class:`CandidatePool` keeps at most *capacity*
+candidates, one per paper, and evicts the lowest scores as better ones
+arrive.
+"""
+from __future__ import annotations
+
+import heapq
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class CandidatePool:
+    """The *capacity* best-scored candidates offered so far, one per key.
+
+    Among equal scores the earlier candidate ranks first, and a candidate
+    replaced by a better score for the same key keeps its original rank in
+    that order, like sorting an insertion-ordered dict by score. Evicted keys
+    are forgotten: one offered again later counts as a new arrival.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(int(capacity), 1)
+        # key -> (score, arrival, candidate)
+        self._entries: Dict[Hashable, Tuple[float, int, Any]] = {}
+        # (score, -arrival, key), the worst candidate on top; replaced entries stay until popped
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._arrivals = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        return entry[2] if entry is not None else None
+
+    def _is_current(self, heap_entry: Tuple[float, int, Hashable]) -> bool:
+        score, negative_arrival, key = heap_entry
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] == score and entry[1] == -negative_arrival
+
+    def _worst(self) -> Tuple[float, int, Hashable]:
+        while not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0]
+
+    def offer(self, key: Hashable, score: float, candidate: Any) -> bool:
+        """Keep *candidate* if it ranks among the best; return whether it was kept."""
+
+        current = self._entries.get(key)
+        if current is not None:
+            if current[0] >= score:
+                return False
+            arrival = current[1]
+        else:
+            if len(self._entries) >= self.capacity:
+                worst_score, _, worst_key = self._worst()
+                # on a tie the newcomer ranks last, so it is the one left out
+                if score <= worst_score:
+                    return False
+                heapq.heappop(self._heap)
+                del self._entries[worst_key]
+            arrival = self._arrivals
+            self._arrivals += 1
+
+        self._entries[key] = (score, arrival, candidate)
+        heapq.heappush(self._heap, (score, -arrival, key))
+        if len(self._heap) > 2 * self.capacity + 64:
+            self._heap = [(score, -arrival, key) for key, (score, arrival, _) in self._entries.items()]
+            heapq.heapify(self._heap)
+        return True
+
+    def ranked(self) -> List[Any]:
+        """Return the candidates from the best score to the worst."""
+
+        return [
+            candidate
+            for _, _, candidate in sorted(self._entries.values(), key=lambda entry: (-entry[0], entry[1]))
+        ]
+
+
+__all__ = ["CandidatePool"]
@@ -1,29 +1,505 @@
-import pandas as pd
+"""Qualis CAPES lookup for the venues returned by Semantic Scholar.
+
+Venues carrying an ISSN are resolved first with an exact dictionary lookup on
+the ``ISSN`` column; fuzzy title matching is only the fallback.
+
+The Qualis table is normalized once when it is loaded: the ``(PRINT)``,
+``(ONLINE)`` and ``(IMPRESSO)`` edition markers are stripped and duplicated
+titles are collapsed. A single venue is narrowed down by a trigram inverted
+index to the titles worth scoring; a batch of venues is scored against the
+whole table in one vectorized :mod:`rapidfuzz` call spread over every core.
+
+Results, including venues without any match, are persisted in a small SQLite
+cache next to the CSV. The cache is tied to the SHA-256 fingerprint of the CSV
+and is emptied automatically when the table is updated.
+
+Nothing is read at import time. The first lookup loads ``qualis-index.pkl``, a
+compiled form of the CSV (normalized titles, strata, ISSN and trigram indexes)
+rebuilt automatically whenever the CSV fingerprint changes.
+"""
+from __future__ import annotations
+
+import csv
+import hashlib
+import os
+import pickle
 import re
-from fuzzywuzzy import fuzz, process
+import sqlite3
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from activity_logger import log_event, log_exception
+from text_normalizer import issn_characters
+
+NOT_FOUND = 'NF'
+
+_ISSN_COLUMN = 'ISSN'
+_TITLE_COLUMN = 'TíTULO'
+_STRATUM_COLUMN = 'ESTRATO'
+_EDITION_PATTERN = re.compile(r'\s*\((PRINT|ONLINE|IMPRESSO)\)\s*')
+_DATA_DIRECTORY = Path(__file__).resolve().parent / 'Data'
+_CSV_PATH = _DATA_DIRECTORY / 'qualis-capes.csv'
+_CACHE_PATH = _DATA_DIRECTORY / 'qualis-cache.sqlite3'
+_COMPILED_PATH = _DATA_DIRECTORY / 'qualis-index.pkl'
+_COMPILED_VERSION = 1
+_BATCH_ROWS = 128
+# venues shorter than this are compared with every title of a compatible length
+_MIN_BLOCKING_LENGTH = 10
+# share of the venue trigrams a title must contain to be scored
+_MIN_SHARED_TRIGRAMS = 0.15
+
+
+def normalize_issn(value: Optional[str]) -> Optional[str]:
+    """Return *value* as ``NNNN-NNNC`` or ``None`` when it is not an ISSN."""
+
+    digits = issn_characters(str(value or '').upper())
+    if len(digits) != 8:
+        return None
+    return f"{digits[:4]}-{digits[4:]}"
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f" {text} "
+    return {padded[position:position + 3] for position in range(len(padded) - 2)}
+
+
+class QualisIndex:
+    """Deduplicated Qualis titles and their strata, ready for fuzzy matching.
+
+    :meth:`lookup` uses a trigram inverted index over the titles to narrow
+    the venue down to the titles it shares enough trigrams with, so
+    ``fuzz.ratio`` only runs on that candidate list. :meth:`lookup_many`
+    scores the whole table at once, which is faster for a batch since the
+    matrix is computed on every core; ``exhaustive=False`` blocks each venue
+    of the batch instead.
+    """
+
+    def __init__(self, titles: List[str], strata: List[str], issn_strata: Dict[str, str]):
+        self.titles = titles
+        self.strata = strata
+        self.issn_strata = issn_strata
+
+        self._postings: Optional[Dict[str, np.ndarray]] = None
+        self._lengths: Optional[np.ndarray] = None
+        self._title_array: Optional[np.ndarray] = None
+        self._length_masks: Dict[tuple, np.ndarray] = {}
+
+    @classmethod
+    def from_rows(
+        cls,
+        titles: Iterable[str],
+        strata: Iterable[str],
+        issns: Optional[Iterable[str]] = None,
+    ) -> "QualisIndex":
+        normalized_titles: List[str] = []
+        title_strata: List[str] = []
+        issn_strata: Dict[str, str] = {}
+        seen = set()
+        if issns is None:
+            issns = repeat(None)
+        for title, stratum, issn in zip(titles, strata, issns):
+            # the CSV repeats its header row between pages of the original export
+            if title == _TITLE_COLUMN:
+                continue
+            normalized_issn = normalize_issn(issn)
+            if normalized_issn is not None:
+                issn_strata.setdefault(normalized_issn, stratum)
+            normalized = _EDITION_PATTERN.sub('', title)
+            # identical titles always score the same, so the first row wins
+            # exactly like the stable sort of the row-by-row scan did
+            if normalized in seen:
+                continue
+            seen.add(normalized)
+            normalized_titles.append(normalized)
+            title_strata.append(stratum)
+        return cls(normalized_titles, title_strata, issn_strata)
+
+    @classmethod
+    def from_csv(cls, path: Path) -> "QualisIndex":
+        with open(path, newline='', encoding="ISO-8859-1") as file_input:
+            rows = list(csv.DictReader(file_input))
+        return cls.from_rows(
+            (row[_TITLE_COLUMN] for row in rows),
+            (row[_STRATUM_COLUMN] for row in rows),
+            (row[_ISSN_COLUMN] for row in rows),
+        )
+
+    def to_compiled(self) -> dict:
+        """Return the picklable form written to ``qualis-index.pkl``."""
+
+        self._ensure_blocking_index()
+        grams = list(self._postings)
+        offsets = np.cumsum([0] + [len(self._postings[gram]) for gram in grams], dtype=np.int64)
+        return {
+            'titles': self.titles,
+            'strata': self.strata,
+            'issn_strata': self.issn_strata,
+            'grams': grams,
+            'gram_offsets': offsets,
+            'gram_postings': np.concatenate([self._postings[gram] for gram in grams]),
+        }
+
+    @classmethod
+    def from_compiled(cls, compiled: dict) -> "QualisIndex":
+        index = cls(compiled['titles'], compiled['strata'], compiled['issn_strata'])
+        offsets = compiled['gram_offsets']
+        postings = compiled['gram_postings']
+        # slices are views on the single postings array, nothing is copied
+        index._postings = {
+            gram: postings[offsets[position]:offsets[position + 1]]
+            for position, gram in enumerate(compiled['grams'])
+        }
+        index._finish_blocking_index()
+        return index
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def lookup_issn(self, issns: Iterable[Optional[str]]) -> Optional[str]:
+        """Return the stratum of the first of *issns* listed in the table."""
+
+        for issn in issns:
+            normalized = normalize_issn(issn)
+            if normalized is not None and normalized in self.issn_strata:
+                return self.issn_strata[normalized]
+        return None
+
+    def _ensure_blocking_index(self) -> None:
+        if self._postings is not None:
+            return
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for position, title in enumerate(self.titles):
+            for gram in _trigrams(title):
+                postings[gram].append(position)
+        # title positions fit in 16 bits for the current table, halving the compiled file
+        dtype = np.uint16 if len(self.titles) <= np.iinfo(np.uint16).max else np.int32
+        self._postings = {gram: np.asarray(ids, dtype=dtype) for gram, ids in postings.items()}
+        self._finish_blocking_index()
+
+    def _finish_blocking_index(self) -> None:
+        self._lengths = np.fromiter((len(title) for title in self.titles), dtype=np.int32, count=len(self.titles))
+        self._title_array = np.asarray(self.titles, dtype=object)
+
+    def candidates(self, query: str, threshold: int = 70) -> np.ndarray:
+        """Return the positions, in table order, of titles worth scoring against *query*.
+
+        The length check is exact: ``fuzz.ratio`` can never exceed
+        ``200 * min(len) / (len_a + len_b)``. The shared trigram check is a
+        heuristic; ``benchmarks.py qualis`` measures its recall against the
+        exhaustive scan.
+        """
+
+        self._ensure_blocking_index()
+
+        candidate_mask = self._length_mask(len(query), threshold)
+        if len(query) < _MIN_BLOCKING_LENGTH:
+            return np.flatnonzero(candidate_mask)
+
+        grams = _trigrams(query)
+        postings = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not postings:
+            return np.empty(0, dtype=np.int64)
+
+        shared = np.bincount(np.concatenate(postings), minlength=len(self.titles))
+        return np.flatnonzero(candidate_mask & (shared >= max(1, int(_MIN_SHARED_TRIGRAMS * len(grams)))))
+
+    def _length_mask(self, query_length: int, threshold: int) -> np.ndarray:
+        key = (query_length, threshold)
+        mask = self._length_masks.get(key)
+        if mask is None:
+            lengths = self._lengths
+            mask = 200 * np.minimum(lengths, query_length) >= (threshold - 0.5) * (lengths + query_length)
+            self._length_masks[key] = mask
+        return mask
+
+    def _lookup_candidates(self, query: str, threshold: int) -> str:
+        positions = self.candidates(query, threshold)
+        if not len(positions):
+            return NOT_FOUND
+
+        scores = process.cdist(
+            [query],
+            self._title_array[positions].tolist(),
+            scorer=fuzz.ratio,
+            dtype=np.float64,
+            score_cutoff=threshold - 0.5,
+        )[0]
+        # scores used to be compared as rounded integers: keep the same ties
+        scores = np.rint(scores)
+        best = int(np.argmax(scores))
+        if scores[best] >= threshold:
+            return self.strata[positions[best]]
+        return NOT_FOUND
+
+    def lookup(self, target_text: str, threshold: int = 70) -> str:
+        """Return the stratum of the title closest to *target_text* or ``'NF'``."""
+
+        if not self.titles:
+            return NOT_FOUND
+        return self._lookup_candidates(target_text.upper(), threshold)
 
-qualis_df = pd.read_csv('Data/qualis-capes.csv', encoding="ISO-8859-1")
+    def lookup_many(
+        self,
+        targets: Sequence[str],
+        threshold: int = 70,
+        workers: int = 1,
+        exhaustive: bool = True,
+    ) -> List[str]:
+        """Return the stratum for each of *targets*, in the same order.
+
+        ``workers=-1`` spreads the venues over every core: rapidfuzz and
+        NumPy release the GIL during the scoring. The trigram blocking of
+        :meth:`lookup` (``exhaustive=False``) keeps a median of about 1800 of
+        the 21000 titles per venue, not enough to beat the full matrix once
+        the per-venue overhead is paid.
+        """
+
+        if not self.titles:
+            return [NOT_FOUND] * len(targets)
+
+        queries = [target.upper() for target in targets]
+        if exhaustive:
+            return self._lookup_exhaustive(queries, threshold, workers)
+
+        if workers == 1 or len(queries) < 2:
+            return [self._lookup_candidates(query, threshold) for query in queries]
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count() if workers < 0 else workers) as executor:
+            return list(executor.map(self._lookup_candidates, queries, repeat(threshold)))
+
+    def _lookup_exhaustive(self, queries: List[str], threshold: int, workers: int) -> List[str]:
+        strata: List[str] = []
+        # float64 keeps the rounding identical to the single lookup; chunking
+        # bounds the matrix to a few tens of megabytes
+        for start in range(0, len(queries), _BATCH_ROWS):
+            scores = process.cdist(
+                queries[start:start + _BATCH_ROWS],
+                self.titles,
+                scorer=fuzz.ratio,
+                dtype=np.float64,
+                score_cutoff=threshold - 0.5,
+                workers=workers,
+            )
+            scores = np.rint(scores)
+            best = np.argmax(scores, axis=1)
+            for row, column in enumerate(best):
+                if scores[row, column] >= threshold:
+                    strata.append(self.strata[column])
+                else:
+                    strata.append(NOT_FOUND)
+        return strata
+
+
+def fingerprint_file(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as file_input:
+        for chunk in iter(lambda: file_input.read(1 << 16), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class QualisCache:
+    """Persistent ``venue -> stratum`` results bound to one version of the CSV.
+
+    Misses are stored as ``'NF'`` as well, so a venue is only ever matched once
+    for a given table. The crawler runs in a background thread, hence the
+    shared connection guarded by a lock.
+    """
+
+    def __init__(self, path: Path, fingerprint: str):
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._connection is not None or self._disabled:
+            return self._connection
+
+        try:
+            connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS matches ("
+                "venue TEXT NOT NULL, threshold INTEGER NOT NULL, stratum TEXT NOT NULL, "
+                "PRIMARY KEY (venue, threshold))"
+            )
+            row = connection.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+            if row is None or row[0] != self.fingerprint:
+                connection.execute("DELETE FROM matches")
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('fingerprint', ?)",
+                    (self.fingerprint,),
+                )
+                log_event(
+                    "QUALIS_CACHE",
+                    "Cache Qualis réinitialisé pour une nouvelle version du fichier",
+                    path=str(self.path),
+                    fingerprint=self.fingerprint,
+                )
+            connection.commit()
+        except sqlite3.Error as exc:
+            self._disabled = True
+            log_exception("QUALIS_CACHE_ERROR", "Cache Qualis indisponible", exc, path=str(self.path))
+            return None
+
+        self._connection = connection
+        return connection
+
+    def get(self, venue: str, threshold: int) -> Optional[str]:
+        return self.get_many([venue], threshold).get(venue)
+
+    def get_many(self, venues: Sequence[str], threshold: int) -> Dict[str, str]:
+        found: Dict[str, str] = {}
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return found
+            # stay well below SQLITE_MAX_VARIABLE_NUMBER
+            for start in range(0, len(venues), 500):
+                chunk = venues[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = connection.execute(
+                    f"SELECT venue, stratum FROM matches WHERE threshold = ? AND venue IN ({placeholders})",
+                    (threshold, *chunk),
+                )
+                found.update(rows)
+        return found
+
+    def put(self, venue: str, threshold: int, stratum: str) -> None:
+        self.put_many({venue: stratum}, threshold)
+
+    def put_many(self, strata: Dict[str, str], threshold: int) -> None:
+        if not strata:
+            return
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return
+            try:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO matches (venue, threshold, stratum) VALUES (?, ?, ?)",
+                    [(venue, threshold, stratum) for venue, stratum in strata.items()],
+                )
+                connection.commit()
+            except sqlite3.Error as exc:
+                log_exception(
+                    "QUALIS_CACHE_ERROR",
+                    "Écriture dans le cache Qualis impossible",
+                    exc,
+                    venues=len(strata),
+                )
+
+
+def load_qualis_index(csv_path: Path = _CSV_PATH, compiled_path: Path = _COMPILED_PATH) -> Tuple[QualisIndex, str]:
+    """Return the index for *csv_path* and its fingerprint.
+
+    The compiled file is reused when it matches the CSV fingerprint; otherwise
+    the CSV is parsed again and the compiled file rewritten.
+    """
+
+    fingerprint = fingerprint_file(csv_path)
+    try:
+        with open(compiled_path, 'rb') as file_input:
+            compiled = pickle.load(file_input)
+        if compiled.get('version') == _COMPILED_VERSION and compiled.get('fingerprint') == fingerprint:
+            return QualisIndex.from_compiled(compiled), fingerprint
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, KeyError) as exc:
+        log_exception("QUALIS_INDEX", "Index Qualis compilé illisible", exc, path=str(compiled_path))
+
+    index = QualisIndex.from_csv(csv_path)
+    compiled = index.to_compiled()
+    compiled['version'] = _COMPILED_VERSION
+    compiled['fingerprint'] = fingerprint
+    temporary_path = Path(f"{compiled_path}.tmp")
+    try:
+        with open(temporary_path, 'wb') as file_output:
+            pickle.dump(compiled, file_output, -1)
+        os.replace(temporary_path, compiled_path)
+    except OSError as exc:
+        log_exception("QUALIS_INDEX", "Écriture de l’index Qualis compilé impossible", exc, path=str(compiled_path))
+    else:
+        log_event(
+            "QUALIS_INDEX",
+            "Index Qualis compilé",
+            path=str(compiled_path),
+            titles=len(index),
+            issns=len(index.issn_strata),
+        )
+    return index, fingerprint
+
+
+_load_lock = threading.Lock()
+_qualis_index: Optional[QualisIndex] = None
+_qualis_cache: Optional[QualisCache] = None
 similarity_memo = {}
 
+
+def _ensure_loaded() -> Tuple[QualisIndex, QualisCache]:
+    global _qualis_index, _qualis_cache
+    with _load_lock:
+        if _qualis_index is None:
+            index, fingerprint = load_qualis_index()
+            _qualis_cache = QualisCache(_CACHE_PATH, fingerprint)
+            _qualis_index = index
+    return _qualis_index, _qualis_cache
+
+
+def get_qualis_index() -> QualisIndex:
+    return _ensure_loaded()[0]
+
+
 def find_similar_journal(target_text, threshold=70):
-    if target_text in similarity_memo:
-        return similarity_memo[target_text] 
-    
-    similar_rows = []
-
-    for _, row in qualis_df.iterrows():
-        pattern = r'\s*\((PRINT|ONLINE|IMPRESSO)\)\s*'
-        value = re.sub(pattern, '', row['TíTULO'])
-        similarity_score = fuzz.ratio(target_text.upper(), value)
-        
-        # If the similarity score is above the threshold, consider it a match
-        if similarity_score >= threshold:
-            similar_rows.append((row['ESTRATO'], similarity_score))
-    
-    # Sort the results by similarity score in descending order
-    similar_rows.sort(key=lambda x: x[1], reverse=True)
-
-    if len(similar_rows) > 0:
-        similarity_memo[target_text] = similar_rows[0][0]
-        return similar_rows[0][0]
-    return 'NF'
\ No newline at end of file
+    return resolve_many([target_text], threshold)[target_text]
+
+
+def find_journal_by_issn(issns: Iterable[Optional[str]]) -> Optional[str]:
+    """Return the stratum of the venue identified by *issns*, ``None`` if unknown."""
+
+    return get_qualis_index().lookup_issn(issns)
+
+
+def resolve_many(venues: Iterable[str], threshold: int = 70) -> Dict[str, str]:
+    """Return a ``venue -> stratum`` mapping for every distinct venue given.
+
+    Venues already seen in this process or stored in the persistent cache are
+    answered directly; the remaining ones are scored together on all cores,
+    or through the trigram blocking of :meth:`QualisIndex.lookup` when only
+    one is left.
+    """
+
+    resolved: Dict[str, str] = {}
+    pending: List[str] = []
+    for venue in dict.fromkeys(venues):
+        memo_key = (venue, threshold)
+        if memo_key in similarity_memo:
+            resolved[venue] = similarity_memo[memo_key]
+        else:
+            pending.append(venue)
+
+    if pending:
+        qualis_index, qualis_cache = _ensure_loaded()
+        cached = qualis_cache.get_many(pending, threshold)
+        unmatched = [venue for venue in pending if venue not in cached]
+        if unmatched:
+            if len(unmatched) == 1:
+                computed = {unmatched[0]: qualis_index.lookup(unmatched[0], threshold)}
+            else:
+                computed = dict(zip(unmatched, qualis_index.lookup_many(unmatched, threshold, workers=-1)))
+            qualis_cache.put_many(computed, threshold)
+            cached.update(computed)
+        for venue in pending:
+            similarity_memo[(venue, threshold)] = cached[venue]
+            resolved[venue] = cached[venue]
+
+    return resolved
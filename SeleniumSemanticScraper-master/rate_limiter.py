@@ -0,0 +1,237 @@
+"""Client-side pacing of the Semantic Scholar requests.
+
+Every thread of a crawl draws from the same limiter, so running the search
+strategies concurrently never sends requests faster than the quota of the
+API key, or than the pool shared by clients without one accepts.
+:class:`AdaptiveRateLimiter`
+also adjusts its rate from the ``X-RateLimit-*`` and ``Retry-After`` headers
+and from the 429 answers it sees, so later requests are paced ahead of time
+instead of running into the limit.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Callable, Mapping, Optional, Tuple
+
+# documented Semantic Scholar quota of an API key: one request per second
+S2_RATE_WITH_KEY = 1.0
+# clients without a key share one pool with no per-client quota, so the
+# limiter starts at a few requests per second and the 429 answers set the pace
+S2_RATE_WITHOUT_KEY = 5.0
+S2_BURST_WITHOUT_KEY = 5
+
+# X-RateLimit-Reset above this is an epoch timestamp rather than a delay
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at *rate* tokens per second.
+
+    :meth:`acquire` reserves its tokens under the lock and sleeps outside
+    of it, so waiting threads are served in the order they arrived.
+    Coroutines use :meth:`acquire_async` on the same bucket.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("Le débit du limiteur doit être positif")
+        self.rate = float(rate)
+        self.capacity = max(float(capacity), 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        # tokens accrue from this instant, which lies in the future during a pause
+        self._updated = clock()
+        self._waiting = 0
+        self._lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests currently waiting for their turn."""
+
+        return self._waiting
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def _reserve(self, tokens: float) -> float:
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= tokens
+            # a negative balance is the debt of the requests already waiting
+            wait = max(self._updated - now, 0.0) + max(-self._tokens, 0.0) / self.rate
+            if wait > 0:
+                self._waiting += 1
+        return wait
+
+    def _stop_waiting(self) -> None:
+        with self._lock:
+            self._waiting -= 1
+
+    def acquire(self, tokens: float = 1.0, cancel: Optional[threading.Event] = None) -> float:
+        """Take *tokens*, sleeping until they are available; return the seconds waited.
+
+        When *cancel* is set during the wait, the wait ends at once and the
+        tokens are given back; the caller checks the event afterwards.
+        """
+
+        wait = self._reserve(tokens)
+        if wait > 0:
+            try:
+                if cancel is None:
+                    self._sleep(wait)
+                elif cancel.wait(wait):
+                    self._release(tokens)
+            finally:
+                self._stop_waiting()
+        return wait
+
+    def _release(self, tokens: float) -> None:
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Coroutine version of :meth:`acquire`, for the asyncio network engine."""
+
+        wait = self._reserve(tokens)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._stop_waiting()
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request back for at least *seconds*."""
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + seconds)
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = float(rate)
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """Token bucket whose rate follows the answers of the server.
+
+    The target rate never exceeds *max_rate*, the documented quota. A 429
+    halves it and pauses every thread for the ``Retry-After`` delay; each
+    run of *increase_after* successful answers raises it again by a tenth
+    of the quota. Within a rate-limit window, ``X-RateLimit-Remaining`` and
+    ``X-RateLimit-Reset`` spread the requests left over the time left, and
+    an exhausted window pauses the requests until it resets.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        *,
+        max_rate: Optional[float] = None,
+        min_rate: float = 0.05,
+        increase_after: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(rate, capacity, clock=clock, sleep=sleep)
+        self.max_rate = float(max_rate or rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.increase_after = increase_after
+        self._wall_clock = wall_clock
+        self._target = min(self.rate, self.max_rate)
+        self._successes = 0
+        self.throttled = 0
+
+    def _window(self, headers: Mapping[str, str]) -> Optional[Tuple[float, float]]:
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        reset = _header_number(headers, "X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return None
+        if reset > _EPOCH_THRESHOLD:
+            reset -= self._wall_clock()
+        return remaining, max(reset, 1.0)
+
+    def record_success(self, headers: Mapping[str, str]) -> None:
+        """Update the rate after a successful answer carrying *headers*."""
+
+        window = self._window(headers)
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.increase_after:
+                self._successes = 0
+                self._target = min(self._target + self.max_rate / 10, self.max_rate)
+            rate = self._target
+        if window is not None:
+            remaining, reset = window
+            if remaining <= 0:
+                self.pause(reset)
+            else:
+                rate = min(rate, max(remaining / reset, self.min_rate))
+        if rate != self.rate:
+            self.set_rate(rate)
+
+    def record_throttle(self, retry_after: Optional[float]) -> None:
+        """Slow down after a 429, pausing for *retry_after* seconds when given."""
+
+        with self._lock:
+            self.throttled += 1
+            self._successes = 0
+            # the threads sent before the pause answer with 429 too; one halving is enough
+            if self._clock() >= self._updated:
+                self._target = max(self._target / 2, self.min_rate)
+            rate = self._target
+        self.set_rate(rate)
+        self.pause(retry_after if retry_after is not None else 1 / rate)
+
+    def status(self) -> dict:
+        """Return the current rate and queue depth, for logs and the interface."""
+
+        return {
+            "rate": round(self.rate, 3),
+            "queue_depth": self.queue_depth,
+            "throttled": self.throttled,
+        }
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def semantic_scholar_limiter(api_key_active: bool) -> AdaptiveRateLimiter:
+    """Return a limiter following the Semantic Scholar quota for this client."""
+
+    if api_key_active:
+        return AdaptiveRateLimiter(S2_RATE_WITH_KEY)
+    return AdaptiveRateLimiter(S2_RATE_WITHOUT_KEY, capacity=S2_BURST_WITHOUT_KEY)
+
+
+__all__ = [
+    "S2_RATE_WITH_KEY",
+    "S2_RATE_WITHOUT_KEY",
+    "TokenBucket",
+    "AdaptiveRateLimiter",
+    "semantic_scholar_limiter",
+]
@@ -0,0 +1,135 @@
+"""Integer ids for the stored articles and authors.
+
+``Articles.pkl`` and ``Authors.pkl`` used to be pickled as cyclic object
+graphs, so each file repeated the records of the other one. An ``Artigo``
+now lists the ids of its authors and an ``Autor`` the ids of its articles;
+:class:`RecordRegistry` binds the records loaded from both files and turns
+the ids back into objects.
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from Artigo import Artigo
+from Autor import Autor
+
+
+def _holds_objects(references: list) -> bool:
+    # a record holds either ids only (registered or loaded) or objects only (new or legacy)
+    return bool(references) and not isinstance(references[0], int)
+
+
+class RecordRegistry:
+    """The articles and authors of one search, by id.
+
+    Records created by the crawler get the next free id when they are
+    added; records loaded from a pickle keep theirs. A record pickled
+    before the ids existed is matched to a known one by its identity (the
+    article's :attr:`~Artigo.identity`, the author's name and link) and its
+    object references are converted to ids. *load_missing* is called once
+    when an id is not known yet, so that the file holding the other kind of
+    record can be loaded on demand.
+    """
+
+    def __init__(self, load_missing: Optional[Callable[[], None]] = None):
+        self.articles: Dict[int, Artigo] = {}
+        self.authors: Dict[int, Autor] = {}
+        self._articles_by_identity: Dict[str, Artigo] = {}
+        self._authors_by_key: Dict[Tuple[str, Optional[str]], Autor] = {}
+        self._next_article_id = 0
+        self._next_author_id = 0
+        self._load_missing = load_missing
+        # records whose references still hold objects, resolved iteratively since
+        # a legacy graph reaches every record of the search
+        self._pending: List[Union[Artigo, Autor]] = []
+        self._resolving = False
+
+    def add_article(self, artigo: Artigo) -> Artigo:
+        """Register *artigo* and return the registered article with the same identity."""
+
+        if artigo._registry is self:
+            return artigo
+        if artigo._registry is not None:
+            raise ValueError("L’article appartient déjà à un autre registre")
+        if artigo.id is not None:
+            known = self.articles.get(artigo.id)
+        else:
+            known = self._articles_by_identity.get(artigo.identity)
+        if known is not None:
+            return known
+
+        if artigo.id is None:
+            artigo.id = self._next_article_id
+        self._next_article_id = max(self._next_article_id, artigo.id + 1)
+        artigo._registry = self
+        self.articles[artigo.id] = artigo
+        self._articles_by_identity.setdefault(artigo.identity, artigo)
+        if _holds_objects(artigo._autores):
+            self.resolve_references(artigo)
+        return artigo
+
+    def add_author(self, autor: Autor) -> Autor:
+        """Register *autor* and return the registered author with the same name and link."""
+
+        if autor._registry is self:
+            return autor
+        if autor._registry is not None:
+            raise ValueError("L’auteur appartient déjà à un autre registre")
+        key = (autor.nome, autor.link)
+        if autor.id is not None:
+            known = self.authors.get(autor.id)
+        else:
+            known = self._authors_by_key.get(key)
+        if known is not None:
+            return known
+
+        if autor.id is None:
+            autor.id = self._next_author_id
+        self._next_author_id = max(self._next_author_id, autor.id + 1)
+        autor._registry = self
+        self.authors[autor.id] = autor
+        self._authors_by_key.setdefault(key, autor)
+        if _holds_objects(autor._artigos):
+            self.resolve_references(autor)
+        return autor
+
+    def resolve_references(self, record: Union[Artigo, Autor]) -> None:
+        """Replace the objects referenced by *record* with their ids, registering them."""
+
+        self._pending.append(record)
+        if self._resolving:
+            return
+        self._resolving = True
+        try:
+            while self._pending:
+                pending = self._pending.pop()
+                if isinstance(pending, Artigo):
+                    pending._autores = [
+                        reference if isinstance(reference, int) else self.add_author(reference).id
+                        for reference in pending._autores
+                    ]
+                else:
+                    pending._artigos = [
+                        reference if isinstance(reference, int) else self.add_article(reference).id
+                        for reference in pending._artigos
+                    ]
+        finally:
+            self._resolving = False
+
+    def _load_other_file(self) -> None:
+        load, self._load_missing = self._load_missing, None
+        if load is not None:
+            load()
+
+    def article(self, article_id: int) -> Artigo:
+        if article_id not in self.articles:
+            self._load_other_file()
+        return self.articles[article_id]
+
+    def author(self, author_id: int) -> Autor:
+        if author_id not in self.authors:
+            self._load_other_file()
+        return self.authors[author_id]
+
+
+__all__ = ["RecordRegistry"]
@@ -0,0 +1,178 @@
+"""Persistent cache of the Semantic Scholar API answers.
+
+Answers are keyed by endpoint and canonical parameters, so two strategies
+whose parameters only differ in spacing or in the order of the requested
+fields share one entry. Entries expire after a TTL, and the least recently
+used ones are evicted once the cache outgrows its size bound.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional
+
+from activity_logger import log_event, log_exception
+from text_normalizer import collapse_whitespace
+
+_DATA_DIRECTORY = Path(__file__).resolve().parent / 'Data'
+_CACHE_PATH = _DATA_DIRECTORY / 's2-response-cache.sqlite3'
+# search results drift slowly; a week keeps re-runs of a search offline
+_DEFAULT_TTL = 7 * 24 * 3600
+_DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def canonical_params(params: Mapping[str, Any]) -> dict:
+    """Return *params* as the API will read them, independent of spelling details."""
+
+    canonical = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        text = collapse_whitespace(str(value))
+        if key == 'fields':
+            text = ",".join(sorted(field.strip() for field in text.split(",") if field.strip()))
+        canonical[str(key)] = text
+    return canonical
+
+
+def request_key(endpoint: str, params: Mapping[str, Any]) -> str:
+    serialized = json.dumps([endpoint, canonical_params(params)], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """SQLite store of decoded JSON answers with a TTL and an LRU size bound.
+
+    The strategies of a crawl run in several threads, hence the shared
+    connection guarded by a lock. Any SQLite error disables the cache for
+    the rest of the run instead of failing the search.
+    """
+
+    def __init__(
+        self,
+        path: Path = _CACHE_PATH,
+        ttl_seconds: float = _DEFAULT_TTL,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._connection is not None or self._disabled:
+            return self._connection
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, created REAL NOT NULL, "
+                "accessed REAL NOT NULL, size INTEGER NOT NULL, body BLOB NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+            connection.commit()
+        except sqlite3.Error as exc:
+            self._disabled = True
+            log_exception("S2_CACHE_ERROR", "Cache des réponses indisponible", exc, path=str(self.path))
+            return None
+
+        self._connection = connection
+        return connection
+
+    def _disable(self, message: str, exc: sqlite3.Error, **details: Any) -> None:
+        # called with the lock held; a broken database is not retried on every request
+        self._disabled = True
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+        log_exception("S2_CACHE_ERROR", message, exc, path=str(self.path), **details)
+
+    def get(self, endpoint: str, params: Mapping[str, Any]) -> Optional[Any]:
+        """Return the cached answer, or ``None`` when it is missing or expired."""
+
+        key = request_key(endpoint, params)
+        now = self._clock()
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return None
+            try:
+                row = connection.execute("SELECT created, body FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                created, body = row
+                if now - created > self.ttl_seconds:
+                    connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    connection.commit()
+                    return None
+                connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                connection.commit()
+            except sqlite3.Error as exc:
+                self._disable("Lecture du cache des réponses impossible, cache désactivé", exc, endpoint=endpoint)
+                return None
+        return json.loads(zlib.decompress(body))
+
+    def put(self, endpoint: str, params: Mapping[str, Any], payload: Any) -> None:
+        body = zlib.compress(json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+        key = request_key(endpoint, params)
+        now = self._clock()
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, endpoint, created, accessed, size, body) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, endpoint, now, now, len(body), sqlite3.Binary(body)),
+                )
+                self._evict(connection, now)
+                connection.commit()
+            except sqlite3.Error as exc:
+                self._disable("Écriture dans le cache des réponses impossible, cache désactivé", exc, endpoint=endpoint)
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        connection.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,))
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in connection.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall():
+            if total <= self.max_bytes:
+                break
+            connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        log_event("S2_CACHE", "Réponses les moins récemment utilisées évincées", evicted=evicted, size=total)
+
+    def clear(self) -> None:
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return
+            try:
+                connection.execute("DELETE FROM responses")
+                connection.commit()
+            except sqlite3.Error as exc:
+                self._disable("Vidage du cache des réponses impossible, cache désactivé", exc)
+
+
+__all__ = [
+    "ResponseCache",
+    "canonical_params",
+    "request_key",
+]
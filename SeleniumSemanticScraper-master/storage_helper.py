@@ -8,14 +8,11 @@ filesystem-related issues reported by users.
 from __future__ import annotations
 
 import os
-import re
 from pathlib import Path
 from typing import Tuple
 
 from activity_logger import log_event, log_exception
-
-_INVALID_CHARS = re.compile(r"[\\/:*?\"<>|]")
-_MULTISPACE = re.compile(r"\s+")
+from text_normalizer import collapse_whitespace, replace_path_characters
 
 
 def sanitize_search_label(label: str) -> str:
@@ -27,8 +24,7 @@ def sanitize_search_label(label: str) -> str:
     issues on some platforms. An empty input falls back to ``"Recherche"``.
     """
 
-    cleaned = _MULTISPACE.sub(" ", (label or "").strip())
-    cleaned = _INVALID_CHARS.sub("_", cleaned)
+    cleaned = replace_path_characters(collapse_whitespace(label or ""))
     cleaned = cleaned.rstrip(" .")
     return cleaned or "Recherche"
 
@@ -0,0 +1,93 @@
+"""Text normalization shared by the crawler, the relevance engine and storage.
+
+Every helper maps characters with a translation table and splits on
+whitespace once, instead of chaining regular expression substitutions.
+:func:`normalize_text` is memoized, so an article's title and abstract are
+normalized once per run however many strategies or engines score them.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+
+# titles and abstracts of a few thousand articles, a few tens of MB at most
+_NORMALIZED_CACHE_SIZE = 8192
+
+
+class _LazyTable(dict):
+    """Translation table filled on first use of each character.
+
+    ``str.translate`` looks characters up with ``__getitem__``, so the table
+    can cover the whole Unicode range while only storing the characters seen.
+    """
+
+    def __init__(self, translate_char):
+        super().__init__()
+        self._translate_char = translate_char
+
+    def __missing__(self, code: int):
+        value = self._translate_char(chr(code))
+        self[code] = value
+        return value
+
+
+# letters and digits are kept, everything else (including "_" and "-") separates words
+_WORD_TABLE = _LazyTable(lambda char: char if char.isalnum() else " ")
+_ISSN_TABLE = _LazyTable(lambda char: char if char in "0123456789X" else None)
+_LABEL_TABLE = str.maketrans({char: "_" for char in '\\/:*?"<>|'})
+
+
+@lru_cache(maxsize=_NORMALIZED_CACHE_SIZE)
+def normalize_text(text: str) -> str:
+    """Lowercase *text* and keep its words separated by single spaces.
+
+    Punctuation, underscores and hyphens count as separators, so
+    ``"K-9 (dogs)"`` becomes ``"k 9 dogs"``.
+    """
+
+    return " ".join(text.lower().translate(_WORD_TABLE).split())
+
+
+def collapse_whitespace(text: str) -> str:
+    """Trim *text* and replace each run of whitespace with one space."""
+
+    return " ".join(text.split())
+
+
+def dedupe_tokens(text: str) -> str:
+    """Collapse the whitespace of *text* and drop words repeating the previous one."""
+
+    deduped = []
+    previous = None
+    for token in text.split():
+        lowered = token.lower()
+        if lowered == previous:
+            continue
+        deduped.append(token)
+        previous = lowered
+    return " ".join(deduped)
+
+
+def replace_path_characters(text: str) -> str:
+    """Replace the characters Windows forbids in file names with ``_``."""
+
+    return text.translate(_LABEL_TABLE)
+
+
+def issn_characters(text: str) -> str:
+    """Return the digits and ``X`` check characters of an uppercase ISSN."""
+
+    return text.translate(_ISSN_TABLE)
+
+
+def clear_normalization_cache() -> None:
+    normalize_text.cache_clear()
+
+
+__all__ = [
+    "normalize_text",
+    "collapse_whitespace",
+    "dedupe_tokens",
+    "replace_path_characters",
+    "issn_characters",
+    "clear_normalization_cache",
+]